@@ -0,0 +1,71 @@
+"""Benchmark peak memory of get_answerset with and without streaming.
+
+Usage:
+    python benchmarks/bench_answerset.py [n_entries]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from drhwrapper import DRHWrapper
+
+import fixtures
+
+
+class FakeResponse:
+    """Minimal requests.Response serving a prepared body."""
+
+    status_code = 200
+    headers = {}
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def measure(func):
+    """Wall time in seconds and peak traced memory in bytes of func()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(n_entries=50_000):
+    body = json.dumps(fixtures.answerset(n_entries)).encode("utf-8")
+    drh = DRHWrapper()
+    print(f"{n_entries} entries, {len(body) / 1024**2:.1f} MB body")
+    with patch.object(drh.session, "get", return_value=FakeResponse(body)):
+        cases = [
+            ("get_answerset", lambda: drh.get_answerset("q")),
+            ("get_answerset(stream=True)", lambda: drh.get_answerset("q", stream=True)),
+            (
+                "iter_answerset(chunk_size=1000)",
+                lambda: sum(len(df) for df in drh.iter_answerset("q")),
+            ),
+        ]
+        for name, func in cases:
+            elapsed, peak = measure(func)
+            print(f"{name:<32} {elapsed:.2f}s  peak: {peak / 1024**2:.1f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,53 @@
+"""Benchmark the memory of DataFrames with and without compact dtypes.
+
+Usage:
+    python benchmarks/bench_compact.py [n_entries]
+"""
+
+import sys
+
+from drhwrapper import DRHWrapper
+
+import fixtures
+
+
+def megabytes(df):
+    return df.memory_usage(deep=True).sum() / 1024**2
+
+
+def main(n_entries=2_000):
+    drh = DRHWrapper()
+    entries = drh.entry_list_to_dataframe(
+        [fixtures.entry(entry_id) for entry_id in range(n_entries)]
+    )
+    answerset = fixtures.answerset(n_entries * 50)
+    entries_page = fixtures.entries_page(n_entries * 50)
+    cases = [
+        (
+            "extract_answer_information",
+            lambda compact: drh.extract_answer_information(entries, compact=compact),
+        ),
+        (
+            "extract_answerset",
+            lambda compact: drh.extract_answerset(answerset, compact=compact),
+        ),
+        (
+            "list_entries_to_dataframe",
+            lambda compact: drh.list_entries_to_dataframe(
+                entries_page, compact=compact
+            ),
+        ),
+    ]
+    for name, build in cases:
+        default_df = build(False)
+        compact_df = build(True)
+        default_size = megabytes(default_df)
+        compact_size = megabytes(compact_df)
+        print(
+            f"{name:<28} {len(default_df):>9} rows  default: {default_size:7.1f} MB  "
+            f"compact: {compact_size:6.1f} MB  reduction: {default_size / compact_size:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,133 @@
+"""Benchmark the list_*_to_dataframe converters against the previous .apply() implementation.
+
+Usage:
+    python benchmarks/bench_converters.py [n_rows]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from drhwrapper import DRHWrapper
+
+import fixtures
+
+
+def _name(x):
+    return f"{x['first_name']} {x['last_name']}"
+
+
+# previous implementations (one .apply() per nested field), kept for comparison
+def legacy_list_entries_to_dataframe(entry_dictionary):
+    df = pd.DataFrame(entry_dictionary["results"])
+    df["entry_id"] = df["id"]
+    df["entry_name"] = df["name"].apply(lambda x: x["name"])
+    df["expert_id"] = df["expert"].apply(lambda x: x["id"])
+    df["expert_name"] = df["expert"].apply(_name)
+    df["poll_id"] = df["poll"].apply(lambda x: x["id"])
+    df["poll_name"] = df["poll"].apply(lambda x: x["name"])
+    df["region_id"] = df["region"].apply(lambda x: x["id"])
+    df["region_name"] = df["region"].apply(lambda x: x["name"])
+    return df[
+        [
+            "entry_id",
+            "entry_name",
+            "expert_id",
+            "expert_name",
+            "poll_id",
+            "poll_name",
+            "date_created",
+            "year_from",
+            "year_to",
+            "region_id",
+            "region_name",
+            "tags",
+        ]
+    ]
+
+
+def legacy_list_tags_to_dataframe(tag_dictionary):
+    df = pd.DataFrame(tag_dictionary["results"])
+    df["entry_tag_id"] = df["id"]
+    df["entry_tag_name"] = df["name"]
+    df["created_by_id"] = df["created_by"].apply(lambda x: x["id"])
+    df["created_by_username"] = df["created_by"].apply(lambda x: x["username"])
+    df["created_by_name"] = df["created_by"].apply(_name)
+    return df[
+        [
+            "entry_tag_id",
+            "entry_tag_name",
+            "approved",
+            "parent_tag_id",
+            "created",
+            "created_by_id",
+            "created_by_username",
+            "created_by_name",
+        ]
+    ]
+
+
+def legacy_list_regions_to_dataframe(region_dictionary):
+    df = pd.DataFrame(region_dictionary["results"])
+    df["region_id"] = df["id"]
+    df["region_name"] = df["name"]
+    df["created_by_id"] = df["created_by"].apply(lambda x: x["id"])
+    df["created_by_name"] = df["created_by"].apply(_name)
+    df["geom"] = df["geom"].apply(lambda x: x["coordinates"])
+    return df[
+        [
+            "region_id",
+            "region_name",
+            "description",
+            "created_by_id",
+            "created_by_name",
+            "geom",
+            "tags",
+        ]
+    ]
+
+
+def best_of(func, payload, repeat=3):
+    """Best wall time in seconds over `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payload)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(n_rows=100_000):
+    cases = [
+        (
+            "list_entries_to_dataframe",
+            fixtures.entries_page(n_rows),
+            legacy_list_entries_to_dataframe,
+            DRHWrapper.list_entries_to_dataframe,
+        ),
+        (
+            "list_entry_tags_to_dataframe",
+            fixtures.tags_page(n_rows),
+            legacy_list_tags_to_dataframe,
+            DRHWrapper.list_entry_tags_to_dataframe,
+        ),
+        (
+            "list_regions_to_dataframe",
+            fixtures.regions_page(n_rows),
+            legacy_list_regions_to_dataframe,
+            DRHWrapper.list_regions_to_dataframe,
+        ),
+    ]
+    print(f"{n_rows} rows")
+    for name, payload, legacy, current in cases:
+        legacy_time = best_of(legacy, payload)
+        current_time = best_of(current, payload)
+        print(
+            f"{name:<32} apply: {legacy_time:.3f}s  single pass: {current_time:.3f}s  "
+            f"speedup: {legacy_time / current_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,41 @@
+"""Benchmark the time of `import drhwrapper` and the modules it loads.
+
+Every run imports the package in a fresh interpreter, so nothing is cached in sys.modules.
+
+Usage:
+    python benchmarks/bench_import.py [repeat]
+"""
+
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "numpy", "tqdm", "aiohttp", "pyarrow", "networkx"]
+
+CODE = f"""
+import sys, time
+start = time.perf_counter()
+import drhwrapper
+elapsed = time.perf_counter() - start
+print(elapsed, " ".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+
+def import_time() -> tuple:
+    """Seconds to import drhwrapper and the heavy modules it loaded."""
+    output = subprocess.run(
+        [sys.executable, "-c", CODE], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), output[1:]
+
+
+def main(repeat=5):
+    timings = []
+    for _ in range(repeat):
+        elapsed, loaded = import_time()
+        timings.append(elapsed)
+    print(f"import drhwrapper: {min(timings) * 1000:7.1f} ms (best of {repeat})")
+    print(f"heavy modules loaded: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,184 @@
+"""Benchmark suite timing the main DRHWrapper operations against a local mock DRH server.
+
+Records wall time (best of --repeat runs), peak traced memory (one extra run under
+tracemalloc) and throughput for every case, and appends the results to a JSON lines file
+tagged with the git commit, so runs of different versions can be compared.
+
+Usage:
+    python benchmarks/bench_suite.py [--entries 200] [--latency 0.02] [--output results.jsonl]
+    python benchmarks/bench_suite.py --compare results.jsonl
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from drhwrapper import DRHWrapper
+
+import fixtures
+from mock_server import MockDRHServer
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(func, repeat: int) -> dict:
+    """Best wall time over repeat runs, then peak memory of one traced run.
+    func returns the number of items (rows, entries) it processed."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    wall = min(timings)
+    return {
+        "wall": wall,
+        "peak_memory": peak,
+        "items": items,
+        "throughput": items / wall if wall else None,
+    }
+
+
+def cases(drh: DRHWrapper, args) -> list:
+    """(name, func) pairs; network cases go through the mock server."""
+    entry_ids = list(range(args.entries))
+    entries_df = drh.dataframe_from_entry_id_list(entry_ids, max_workers=args.workers)
+    pages = {
+        "list_entries_to_dataframe": fixtures.entries_page(args.rows),
+        "list_entry_tags_to_dataframe": fixtures.tags_page(args.rows),
+        "list_regions_to_dataframe": fixtures.regions_page(args.rows),
+        "list_region_tags_to_dataframe": fixtures.tags_page(args.rows, seed=1),
+    }
+    relations = pd.DataFrame(fixtures.question_relations(args.relations))
+
+    benchmarks = [
+        (
+            "dataframe_from_entry_id_list",
+            lambda: len(
+                drh.dataframe_from_entry_id_list(entry_ids, max_workers=args.workers)
+            ),
+        ),
+        ("get_answerset", lambda: len(drh.get_answerset("question"))),
+        (
+            "get_answerset(stream=True)",
+            lambda: len(drh.get_answerset("question", stream=True)),
+        ),
+    ]
+    for name, page in pages.items():
+        converter = getattr(DRHWrapper, name)
+        benchmarks.append(
+            (name, lambda converter=converter, page=page: len(converter(page)))
+        )
+    benchmarks += [
+        (
+            "extract_answer_information",
+            lambda: len(drh.extract_answer_information(entries_df)),
+        ),
+        (
+            "simplify_question_relations",
+            lambda: len(DRHWrapper.simplify_question_relations(relations)),
+        ),
+    ]
+    return benchmarks
+
+
+def run(args):
+    server = MockDRHServer(
+        n_entries=args.entries,
+        n_questions=args.questions,
+        n_answerset_entries=args.answerset_entries,
+        n_relations=args.relations,
+        latency=args.latency,
+    )
+    run_info = {
+        "commit": git_commit(),
+        "time": datetime.now(timezone.utc).isoformat(),
+        "params": vars(args),
+    }
+    results = []
+    with server, DRHWrapper(hostname=server.hostname, max_retries=1) as drh:
+        for name, func in cases(drh, args):
+            result = {"case": name, **measure(func, args.repeat), **run_info}
+            results.append(result)
+            print(
+                f"{name:<32} {result['wall']:8.3f}s  "
+                f"peak: {result['peak_memory'] / 1024**2:8.1f} MB  "
+                f"{result['throughput']:12,.0f} items/s"
+            )
+    if args.output:
+        with open(args.output, "a") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+
+
+def compare(path: str):
+    """Prints the wall time of every case for each commit in a results file."""
+    walls = defaultdict(dict)
+    commits = []
+    with open(path) as f:
+        for line in f:
+            result = json.loads(line)
+            if result["commit"] not in commits:
+                commits.append(result["commit"])
+            # the latest run of a commit wins
+            walls[result["case"]][result["commit"]] = result["wall"]
+    print(f"{'case':<32}" + "".join(f"{commit:>12}" for commit in commits))
+    for case, by_commit in walls.items():
+        print(
+            f"{case:<32}"
+            + "".join(
+                f"{by_commit[commit]:11.3f}s" if commit in by_commit else f"{'-':>12}"
+                for commit in commits
+            )
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries", type=int, default=200, help="entries fetched one by one"
+    )
+    parser.add_argument(
+        "--questions", type=int, default=100, help="questions per entry"
+    )
+    parser.add_argument("--answerset-entries", type=int, default=20_000)
+    parser.add_argument("--rows", type=int, default=50_000, help="rows per list page")
+    parser.add_argument("--relations", type=int, default=50_000)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="seconds per response"
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="append results to this JSON lines file")
+    parser.add_argument(
+        "--compare", metavar="RESULTS", help="compare commits in a results file"
+    )
+    args = parser.parse_args(argv)
+    if args.compare:
+        compare(args.compare)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
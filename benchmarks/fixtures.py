@@ -0,0 +1,209 @@
+"""Synthetic DRH API payloads for benchmarks."""
+
+import random
+
+
+def _user(user_id: int) -> dict:
+    return {
+        "id": user_id,
+        "username": f"user_{user_id}",
+        "first_name": f"First{user_id}",
+        "last_name": f"Last{user_id}",
+    }
+
+
+def entries_page(n: int, seed: int = 0) -> dict:
+    """Page of the `entries` list endpoint with n results."""
+    rng = random.Random(seed)
+    results = []
+    for entry_id in range(n):
+        year_from = rng.randint(-3000, 1900)
+        results.append(
+            {
+                "id": entry_id,
+                "name": {"id": entry_id + 1, "name": f"Entry {entry_id}"},
+                "expert": {
+                    "id": rng.randint(1, 500),
+                    "first_name": "Jane",
+                    "last_name": f"Doe{rng.randint(1, 500)}",
+                },
+                "poll": {"id": rng.randint(1, 8), "name": "Religious Group (v6)"},
+                "date_created": "2020-08-04T03:44:24.479188Z",
+                "year_from": year_from,
+                "year_to": year_from + rng.randint(0, 500),
+                "region": {"id": rng.randint(1, 2000), "name": f"Region {entry_id}"},
+                "tags": [{"id": 8, "name": "Religious Group"}],
+            }
+        )
+    return {"count": n, "next": None, "previous": None, "results": results}
+
+
+def tags_page(n: int, seed: int = 0) -> dict:
+    """Page of the `entry_tags` or `region_tags` list endpoint with n results."""
+    rng = random.Random(seed)
+    results = [
+        {
+            "id": tag_id,
+            "name": f"Tag {tag_id}",
+            "approved": rng.random() < 0.9,
+            "parent_tag_id": rng.choice([None, rng.randint(1, 100)]),
+            "created": "2016-05-17T02:39:38.090109Z",
+            "created_by": _user(rng.randint(1, 500)),
+        }
+        for tag_id in range(n)
+    ]
+    return {"count": n, "next": None, "previous": None, "results": results}
+
+
+def regions_page(n: int, seed: int = 0) -> dict:
+    """Page of the `regions` list endpoint with n results."""
+    rng = random.Random(seed)
+    results = [
+        {
+            "id": region_id,
+            "name": f"Region {region_id}",
+            "description": f"Description of region {region_id}",
+            "created_by": _user(rng.randint(1, 500)),
+            "geom": {
+                "type": "MultiPolygon",
+                "coordinates": [[[[rng.uniform(-180, 180), rng.uniform(-90, 90)]]]],
+            },
+            "tags": [{"id": 1, "name": "Asia"}],
+        }
+        for region_id in range(n)
+    ]
+    return {"count": n, "next": None, "previous": None, "results": results}
+
+
+def _question(rng, question_id: int, depth: int) -> dict:
+    answer_sets = []
+    for answer_set_id in range(rng.randint(1, 2)):
+        answers = []
+        for answer_id in range(rng.randint(1, 2)):
+            sub_questions = []
+            if depth < 2 and rng.random() < 0.3:
+                sub_question = _question(rng, question_id * 10 + answer_id, depth + 1)
+                # the API occasionally repeats sub-questions
+                sub_questions = [sub_question, sub_question]
+            answers.append(
+                {
+                    "id": question_id * 100 + answer_id,
+                    "name": rng.choice(["Yes", "No", "Field doesn't know"]),
+                    "value": rng.choice([1, 0, -1]),
+                    "text_input": rng.choice([None, "Some text"]),
+                    "sub_questions": sub_questions,
+                }
+            )
+        answer_sets.append(
+            {
+                "id": question_id * 10 + answer_set_id,
+                "year_from": rng.randint(-1000, 0),
+                "year_to": rng.randint(0, 1000),
+                "region_id": rng.randint(1, 2000),
+                "expert_id": rng.randint(1, 500),
+                "status_of_participants": rng.sample([0, 1, 2], rng.randint(1, 3)),
+                "answers": answers,
+                "notes": rng.choice([None, "A note"]),
+            }
+        )
+    return {
+        "id": question_id,
+        "name": f"Question {question_id}?",
+        "answer_sets": answer_sets,
+    }
+
+
+def entry(entry_id: int, n_questions: int = 100, seed: int = 0) -> dict:
+    """Entry as returned by the `entries/<id>` find endpoint with about n_questions answered."""
+    rng = random.Random(seed + entry_id)
+    half = n_questions // 2
+    return {
+        "id": entry_id,
+        "name": {"id": entry_id + 1, "name": f"Entry {entry_id}"},
+        "description": f"Description of entry {entry_id}",
+        "date_created": "2020-08-04T03:44:24.479188Z",
+        "year_from": -500,
+        "year_to": 500,
+        "region": {
+            "id": entry_id % 2000,
+            "name": f"Region {entry_id}",
+            "description": "A region",
+            "geojson": {"type": "MultiPolygon", "coordinates": [[[[0.0, 0.0]]]]},
+        },
+        "expert": {"id": 1, "first_name": "Jane", "last_name": "Doe"},
+        "poll": {"id": 8, "name": "Religious Group (v6)"},
+        "tags": [{"id": 8, "name": "Religious Group"}],
+        "categories": [
+            {
+                "id": 1,
+                "name": "Religious Beliefs",
+                "questions": [_question(rng, 1000 + i, 0) for i in range(half)],
+                "groups": [],
+            },
+            {
+                "id": 2,
+                "name": "Religious Practices",
+                "questions": [],
+                "groups": [
+                    {
+                        "id": 20 + group_id,
+                        "name": f"Group {group_id}",
+                        "questions": [
+                            _question(rng, 2000 + group_id * 100 + i, 0)
+                            for i in range(half // 2)
+                        ],
+                    }
+                    for group_id in range(2)
+                ],
+            },
+        ],
+    }
+
+
+def answerset(n_entries: int, n_answers: int = 3, seed: int = 0) -> list:
+    """Response of the `entries-by-question` endpoint with n_entries entries."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": entry_id,
+            "title": f"Entry {entry_id}",
+            "date_created": "2020-08-04T03:44:24.479188Z",
+            "poll": {"id": rng.randint(1, 8), "name": "Religious Group (v6)"},
+            "question_id": 4828,
+            "answers": [
+                {
+                    "name": rng.choice(["Yes", "No", "Field doesn't know"]),
+                    "value": rng.choice([1, 0, -1]),
+                    "year_from": rng.randint(-1000, 0),
+                    "year_to": rng.randint(0, 1000),
+                    "expert": {
+                        "expert_id": rng.randint(1, 500),
+                        "first_name": "Jane",
+                        "last_name": f"Doe{rng.randint(1, 500)}",
+                    },
+                    "region_id": rng.randint(1, 2000),
+                    "status_of_participants": {
+                        "id": 0,
+                        "name": rng.choice(
+                            ["Elite", "Non-elite (common people, general populace)"]
+                        ),
+                    },
+                }
+                for _ in range(rng.randint(1, n_answers))
+            ],
+        }
+        for entry_id in range(n_entries)
+    ]
+
+
+def question_relations(n: int, n_questions: int = None, seed: int = 0) -> list:
+    """Response of the `questionrelation` endpoint with n pairs of related questions."""
+    rng = random.Random(seed)
+    n_questions = n_questions or max(2, n)
+    return [
+        {
+            "first_question_id": rng.randint(1, n_questions),
+            "second_question_id": rng.randint(1, n_questions),
+        }
+        for _ in range(n)
+    ]
@@ -0,0 +1,148 @@
+"""Local stand-in for the DRH API serving synthetic payloads (see fixtures).
+
+Usage:
+    with MockDRHServer(n_entries=1000, latency=0.05) as server:
+        drh = DRHWrapper(hostname=server.hostname)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import fixtures
+
+
+class MockDRHServer:
+    """Threaded HTTP server answering the DRH endpoints with synthetic data.
+
+    Responses are serialized once and served from memory, so benchmarks measure the client.
+    Every response is delayed by `latency` seconds to simulate the network.
+    """
+
+    def __init__(
+        self,
+        n_entries: int = 1000,
+        n_questions: int = 100,
+        n_regions: int = 1000,
+        n_tags: int = 500,
+        n_answerset_entries: int = 1000,
+        n_relations: int = 1000,
+        latency: float = 0.0,
+        ver: str = "v1",
+    ):
+        self.n_entries = n_entries
+        self.n_questions = n_questions
+        self.latency = latency
+        self.ver = ver
+        self.requests = 0
+        self._lists = {
+            "entries": fixtures.entries_page(n_entries)["results"],
+            "regions": fixtures.regions_page(n_regions)["results"],
+            "entry_tags": fixtures.tags_page(n_tags)["results"],
+            "region_tags": fixtures.tags_page(n_tags, seed=1)["results"],
+        }
+        self._bodies = {
+            "entries-by-question": self.encode(fixtures.answerset(n_answerset_entries)),
+            "questionrelation": self.encode(fixtures.question_relations(n_relations)),
+        }
+        self._entry_bodies = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @staticmethod
+    def encode(payload) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    @property
+    def hostname(self) -> str:
+        """Hostname (with scheme) to pass to DRHWrapper(hostname=...)."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def entry_body(self, entry_id: int) -> bytes:
+        # entries are generated on first request
+        if entry_id not in self._entry_bodies:
+            self._entry_bodies[entry_id] = self.encode(
+                fixtures.entry(entry_id, self.n_questions)
+            )
+        return self._entry_bodies[entry_id]
+
+    def page_body(self, endpoint: str, url: str, query: dict) -> bytes:
+        results = self._lists[endpoint]
+        limit = int(query.get("limit", ["25"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        following = offset + limit
+        return self.encode(
+            {
+                "count": len(results),
+                "next": (
+                    f"{url}?limit={limit}&offset={following}"
+                    if following < len(results)
+                    else None
+                ),
+                "previous": None,
+                "results": results[offset:following],
+            }
+        )
+
+    def respond(self, path: str) -> bytes:
+        """Body for a request path, None if the path is unknown."""
+        url = urlparse(path)
+        parts = [part for part in url.path.split("/") if part]
+        if not parts or parts[0] != self.ver or len(parts) not in (2, 3):
+            return None
+        endpoint = parts[1]
+        if len(parts) == 3:
+            if endpoint == "entries" and parts[2].isdigit():
+                if int(parts[2]) < self.n_entries:
+                    return self.entry_body(int(parts[2]))
+            return None
+        if endpoint in self._lists:
+            return self.page_body(
+                endpoint, f"{self.hostname}{url.path}", parse_qs(url.query)
+            )
+        return self._bodies.get(endpoint)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                body = server.respond(self.path)
+                if body is None:
+                    self.send_response(404)
+                    body = b'{"detail": "Not found."}'
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -1,6 +1,12 @@
 # drhwrapper
 
 from .api import DRHWrapper
+from .async_api import AsyncDRHWrapper
+from .metrics import Metrics, logging_hook
+from .question_index import QuestionIndex
+from .rate_limit import RateLimiter
+from .retry import RetryBudget
+from .snapshot import SnapshotStore
 
-# __all__ = ['DRHWrapper']
+# __all__ = ['DRHWrapper', 'AsyncDRHWrapper']
 # __version__ = '0.1.0'
@@ -0,0 +1,41 @@
+import importlib
+import importlib.util
+import types
+from typing import Union
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    Keeps `import drhwrapper` cheap: pandas, numpy, tqdm, aiohttp and pyarrow are loaded
+    by the first method that needs them rather than when the package is imported.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+
+    def _load(self) -> types.ModuleType:
+        module = importlib.import_module(self.__name__)
+        # later lookups find the attributes directly, without going through __getattr__
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._load(), attribute)
+
+
+def lazy_import(name: str, optional: bool = False) -> Union[LazyModule, None]:
+    """Module that is imported on first use.
+
+    Args:
+        name (str): name of the module, e.g. "pandas" or "pyarrow.dataset".
+        optional (bool, optional): Return None if the (top level) package is not installed,
+            which is checked without importing it. Defaults to False.
+
+    Returns:
+        Union[LazyModule, None]: the lazy module.
+    """
+    if optional and importlib.util.find_spec(name.partition(".")[0]) is None:
+        return None
+    return LazyModule(name)
@@ -1,14 +1,195 @@
+from __future__ import annotations
+
 import requests
 import requests.packages
-from typing import List, Dict, Union
-import pandas as pd
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Callable, Iterable, Iterator, List, Dict, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+from datetime import datetime, timezone
+import codecs
+import functools
+import gc
+import heapq
+import importlib.util
+import json
 import os
-from tqdm import tqdm
-import numpy as np
+import sys
 import time
 import random
-import networkx as nx
+import threading
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from ._lazy import lazy_import
+from .cache import ResponseCache
+from .metrics import Metrics
+from .question_index import QuestionIndex
+from .rate_limit import RateLimiter
+from .retry import RetryBudget, is_retryable
+from .snapshot import SnapshotStore
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+tqdm = lazy_import("tqdm")
+
+# columns of the DataFrame built by DRHWrapper.extract_answer_information
+ANSWER_COLUMNS = [
+    "entry_id",
+    "entry_name",
+    "question_set_id",
+    "question_set_name",
+    "question_group_id",
+    "question_group_name",
+    "question_id",
+    "question_name",
+    "parent_question_id",
+    "answer_set_id",
+    "answer_set_year_from",
+    "answer_set_year_to",
+    "answer_set_region_id",
+    "answer_set_expert_id",
+    "answer_set_status_of_participants_value",
+    "answer_set_status_of_participants_name",
+    "answer_id",
+    "answer_name",
+    "answer_value",
+    "answer_text",
+    "notes",
+]
+
+# columns of the DataFrame built by DRHWrapper.extract_answerset
+ANSWERSET_COLUMNS = [
+    "entry_id",
+    "entry_name",
+    "poll_id",
+    "poll_name",
+    "question_id",
+    "answer_name",
+    "answer_value",
+    "year_from",
+    "year_to",
+    "region_id",
+    "status_participants",
+    "expert_id",
+    "expert_name",
+    "date_created",
+]
+
+RECODE_COMPLEXITY = {
+    0: "Elite",
+    1: "Religious Specialists",
+    2: "Non-elite (common people, general populace)",
+}
+
+# marks questions (as opposed to answers) on the stack of extract_answer_columns
+QUESTION = object()
+
+
+def _init_shard_worker(entries: list):
+    """Process pool initializer: keeps the entries (inherited without copying when forked)."""
+    global _shard_entries
+    _shard_entries = entries
+    # inherited objects are never garbage, so keep the collector from scanning them
+    gc.freeze()
+
+
+def _extract_shard(bounds: tuple) -> dict:
+    """Process pool task: extracts answers of the entries in [start, stop)."""
+    start, stop = bounds
+    return _extract_shard_columns(_shard_entries[start:stop])
+
+
+def _extract_shard_columns(entries: list) -> dict:
+    """Extracts answers of (entry_id, entry_name, categories) tuples into columns (process pool task)."""
+    columns = {column: [] for column in ANSWER_COLUMNS}
+    for entry_id, entry_name, question_sets in entries:
+        DRHWrapper.extract_entry_answer_columns(
+            columns, entry_id, entry_name, question_sets
+        )
+    return columns
+
+
+def _intern(value):
+    """Interns strings repeated across answers (question and answer names)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _run_in_thread(func: Callable, *args, **kwargs) -> Future:
+    """Calls func in a new daemon thread, returning a future of its result."""
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """Incrementally decodes a JSON array from byte chunks, yielding its elements one at a time.
+    Only the undecoded tail of the body is buffered, never the whole array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    # what may follow: an element or "]" (after "["), an element (after ","),
+    # or a separator "," or "]" (after an element)
+    expected = "first"
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        buffer += text_decoder.decode(chunk or b"", final=final)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position == len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError(
+                        f"Expected a JSON array, got: {buffer[position:position + 200]}"
+                    )
+                started = True
+                position += 1
+                continue
+            if expected == "separator":
+                if buffer[position] == "]":
+                    return
+                if buffer[position] != ",":
+                    raise json.JSONDecodeError("Expected ',' or ']'", buffer, position)
+                expected = "element"
+                position += 1
+                continue
+            if buffer[position] == "]" and expected == "first":
+                return
+            if buffer[position] in ",]":
+                raise json.JSONDecodeError("Expected an element", buffer, position)
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # element continues in the next chunk
+            # a number like 1.5e3 may still continue in the next chunk, so an element at
+            # the end of the buffer waits for the next chunk
+            if end == len(buffer) and not final:
+                break
+            yield element
+            expected = "separator"
+            position = end
+        buffer = buffer[position:]
+    raise json.JSONDecodeError("Incomplete JSON array", buffer, len(buffer))
 
 
 class DRHWrapper:
@@ -18,6 +199,42 @@ class DRHWrapper:
     This class provides read access to the Database of Religious History (DRH) API.
     """
 
+    # parameters accepted by the list endpoints
+    ENTRY_PARAMS = [
+        "expert",
+        "start_date",
+        "end_date",
+        "limit",
+        "offset",
+        "ordering",
+        "region",
+        "poll",
+    ]
+    ENTRY_TAG_PARAMS = [
+        "approved",
+        "created_by",
+        "start_date",
+        "end_date",
+        "limit",
+        "offset",
+        "ordering",
+    ]
+    REGION_PARAMS = [
+        "created_by",
+        "start_date",
+        "end_date",
+        "limit",
+        "offset",
+        "ordering",
+    ]
+    REGION_TAG_PARAMS = ENTRY_TAG_PARAMS
+
+    # (connect, read) timeouts in seconds of endpoints slower than the default timeout
+    ENDPOINT_TIMEOUTS = {"entries-by-question": (10, 300)}
+
+    # requests to an endpoint needed before its latency quantile is used for hedging
+    HEDGE_MIN_SAMPLES = 20
+
     def __init__(
         self,
         hostname: str = "religiondatabase.org/public-api",
@@ -26,48 +243,448 @@ class DRHWrapper:
         max_retries=10,
         base_delay=1,
         max_delay=120,
+        pool_size=10,
+        compression=True,
+        cache_path: str = None,
+        cache_ttl: dict = None,
+        cache_max_size: int = 512 * 1024**2,
+        find_cache_size: int = 0,
+        rate_limit: float = None,
+        max_concurrent: int = None,
+        retry_budget: float = None,
+        timeout: Union[float, Tuple[float, float]] = (10, 60),
+        endpoint_timeouts: dict = None,
+        hedge_quantile: float = None,
+        hook: Callable[[dict], None] = None,
     ):
         """
         Initializes the API wrapper
-        :param hostname: The hostname of the API
+        :param hostname: The hostname of the API (https is assumed unless a scheme is given)
         :param api_key: The API key
         :param ver: The version of the API
+        :param pool_size: Number of keep-alive connections kept open to the API
+        :param compression: Accept compressed (gzip, deflate and brotli if installed) responses
+        :param cache_path: Path of a SQLite file to cache responses on disk (disabled if None)
+        :param cache_ttl: Time to live in seconds per endpoint (see ResponseCache.DEFAULT_TTL)
+        :param cache_max_size: Maximum size of the on-disk cache in bytes
+        :param find_cache_size: Number of find_* responses kept in memory (disabled if 0)
+        :param rate_limit: Maximum number of requests per second across all endpoints (unlimited if None)
+        :param max_concurrent: Maximum number of requests in flight, lowered while the server throttles
+        :param retry_budget: Maximum ratio of retries to requests within a minute (see RetryBudget, unlimited if None)
+        :param timeout: Connect and read timeout in seconds, as a number or a (connect, read) tuple
+        :param endpoint_timeouts: Timeouts per endpoint, merged with ENDPOINT_TIMEOUTS
+        :param hedge_quantile: Latency quantile (e.g. 0.95) of an endpoint after which find_* and get_answerset send a duplicate request and return the first response (disabled if None)
+        :param hook: Called with every request, cache, retry and parse event (see Metrics)
         """
-        self.base_url = "https://{}/{}".format(hostname, ver)
+        self.base_url = self.build_base_url(hostname, ver)
         self._api_key = api_key
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
 
+        # one pooled session (keep-alive) shared by all endpoints
+        self.session = requests.Session()
+        # hedged requests get connections of their own (see ._hedge())
+        hedge_slots = pool_size if hedge_quantile is not None else 0
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size + hedge_slots
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = (
+            ACCEPT_ENCODING if compression else "identity"
+        )
+
+        # opt-in persistent response cache
+        self.cache = None
+        if cache_path is not None:
+            self.cache = ResponseCache(
+                cache_path, ttl=cache_ttl, max_size=cache_max_size
+            )
+
+        # opt-in in-memory LRU cache for find_* lookups
+        self.find_cache_size = find_cache_size
+        self._find_cache = OrderedDict()
+        self._find_cache_lock = threading.Lock()
+        self._find_cache_hits = 0
+        self._find_cache_misses = 0
+
+        # request and parsing metrics, summarized by .stats()
+        self.metrics = Metrics(hook)
+
+        # opt-in rate limiter shared by all endpoints
+        self.rate_limiter = None
+        if rate_limit is not None or max_concurrent is not None:
+            self.rate_limiter = RateLimiter(rate_limit, max_concurrent=max_concurrent)
+
+        # opt-in retry budget shared by all endpoints
+        self.retry_budget = None
+        if retry_budget is not None:
+            self.retry_budget = RetryBudget(retry_budget)
+        # set while a call is retried by a delay queue instead (see ._map_with_retries())
+        self._retry_state = threading.local()
+
+        self.timeout = timeout
+        self.endpoint_timeouts = {**self.ENDPOINT_TIMEOUTS, **(endpoint_timeouts or {})}
+
+        # opt-in hedged requests, at most hedge_slots duplicates in flight
+        self.hedge_quantile = hedge_quantile
+        self._hedge_slots = threading.BoundedSemaphore(max(1, hedge_slots))
+
+    def close(self):
+        """Closes the pooled HTTP session and the response cache."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def cache_info(self) -> dict:
+        """Hit/miss counters and size of the on-disk response cache.
+
+        Returns:
+            dict: `hits`, `misses`, `revalidations`, `entries` and `size` (empty if caching is disabled).
+        """
+        if self.cache is None:
+            return {}
+        return self.cache.info()
+
+    def stats(self) -> dict:
+        """Summary of the requests, cache lookups, retries and parsing stages so far.
+
+        Returns:
+            dict: see Metrics.stats().
+        """
+        return self.metrics.stats()
+
+    def _parse(self, converter: Callable, *args, **kwargs):
+        """Calls a parsing stage (e.g. .list_entries_to_dataframe()) and records its duration."""
+        with self.metrics.parse(converter.__name__) as parse:
+            result = converter(*args, **kwargs)
+            parse["rows"] = len(result)
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     # this is currently needed.
     def retry_api_call(method):
+        @functools.wraps(method)
         def wrapper_api_call(self, *args, **kwargs):
-            base_delay = self.base_delay
-            max_delay = self.max_delay
+            if getattr(self._retry_state, "deferred", False):
+                return method(self, *args, **kwargs)
 
-            last_exception = None
-            for attempt in range(self.max_retries):
+            attempt = 0
+            while True:
                 try:
                     return method(self, *args, **kwargs)
                 except (requests.exceptions.RequestException, ValueError) as e:
-                    print(f"Attempt {attempt + 1} failed with error: {e}")
-                    last_exception = e
+                    attempt += 1
+                    print(f"Attempt {attempt} failed with error: {e}")
+                    delay = self._retry_delay(method.__name__, e, attempt)
+                    if delay is None:
+                        raise
+                    print(f"Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
+
+        return wrapper_api_call
 
-                    # Calculate the next delay
-                    delay = min(base_delay * (2**attempt), max_delay)
+    def _retry_delay(
+        self, method_name: str, error: Exception, attempt: int
+    ) -> Union[float, None]:
+        """Exponential backoff before retrying a call that failed attempt times.
 
-                    # Optional: add jitter to prevent storming server in lockstep
-                    jitter = random.uniform(
-                        0, delay * 0.1
-                    )  # Jitter of up to 10% of the delay
-                    delay_with_jitter = delay + jitter
+        Returns:
+            Union[float, None]: delay in seconds, or None if the call must not be retried
+                (error not retryable, max_retries or the retry budget exhausted).
+        """
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        if self.retry_budget is not None and not self.retry_budget.withdraw():
+            return None
+        delay = min(self.base_delay * (2 ** (attempt - 1)), self.max_delay)
+        # jitter of up to 10% of the delay to prevent storming the server in lockstep
+        delay += random.uniform(0, delay * 0.1)
+        self.metrics.record(
+            {
+                "type": "retry",
+                "method": method_name,
+                "attempt": attempt,
+                "error": repr(error),
+                "delay": delay,
+            }
+        )
+        return delay
 
-                    print(f"Retrying in {delay_with_jitter:.2f} seconds...")
-                    time.sleep(delay_with_jitter)
+    def _send(self, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Sends a GET request through the pooled session, paced by the rate limiter and
+        bounded by the timeout of the endpoint. Error responses (4xx, 5xx) raise an HTTPError; throttled (429) and failed (5xx)
+        requests are retried, client errors are not (see is_retryable()).
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        kwargs.setdefault("timeout", self.endpoint_timeouts.get(endpoint, self.timeout))
+        status_code = retry_after = None
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url=url, **kwargs)
+            status_code = response.status_code
+            retry_after = response.headers.get("Retry-After")
+        except Exception as e:
+            self.metrics.request(endpoint, start, error=repr(e))
+            raise
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release(status_code, retry_after)
+        self.metrics.request(
+            endpoint,
+            start,
+            status=status_code,
+            bytes=self._response_size(response, kwargs.get("stream", False)),
+        )
+        if status_code >= 400:
+            response.close()
+            raise requests.exceptions.HTTPError(
+                f"{status_code} Error: {response.reason} for url: {response.url}",
+                response=response,
+            )
+        return response
 
-            raise last_exception
+    @staticmethod
+    def _response_size(response: requests.Response, stream=False) -> Union[int, None]:
+        """Bytes received for a response (its Content-Length while a streamed body is unread)."""
+        if stream:
+            length = response.headers.get("Content-Length")
+            return int(length) if length is not None else None
+        return len(response.content)
+
+    def _record_cache(self, endpoint: str, cache: str, outcome: str):
+        self.metrics.record(
+            {"type": "cache", "endpoint": endpoint, "cache": cache, "outcome": outcome}
+        )
 
-        return wrapper_api_call
+    def _get_json(self, *path: str, params: dict = None, refresh=False):
+        """Sends a GET request through the pooled session and decodes the JSON body.
+        Served from (and stored in) the response cache when caching is enabled.
+        With refresh=True a cached response is revalidated with the API even if it is
+        still fresh.
+        """
+        url = os.path.join(self.base_url, *path)
+        if self.cache is None:
+            return self._send(path[0], url, params=params).json()
+
+        endpoint = path[0]
+        key = self.cache.make_key(endpoint, "/".join(path[1:]) or None, params)
+        cached = self.cache.get(key)
+        if cached is not None and cached["fresh"] and not refresh:
+            self.cache.count("hits")
+            self._record_cache(endpoint, "response", "hit")
+            return cached["payload"]
+
+        headers = cached["headers"] if cached is not None else None
+        response = self._send(endpoint, url, params=params, headers=headers)
+        if cached is not None and response.status_code == 304:
+            self.cache.refresh(key)
+            self.cache.count("revalidations")
+            self._record_cache(endpoint, "response", "revalidated")
+            return cached["payload"]
+
+        self.cache.count("misses")
+        self._record_cache(endpoint, "response", "miss")
+        payload = response.json()
+        if response.status_code == 200:
+            self.cache.set(
+                key,
+                endpoint,
+                payload,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return payload
+
+    def _hedge(self, endpoint: str, func: Callable, *args, **kwargs):
+        """Calls func, and calls it a second time if it has not returned after the
+        hedge_quantile latency of endpoint. The first successful result is returned
+        (the other call runs to completion in the background).
+        Every call gets a thread of its own, so it never waits behind other calls, and the
+        duplicate is skipped while pool_size duplicates are already in flight.
+        Only for idempotent requests, e.g. ._get_json().
+        """
+        delay = None
+        if self.hedge_quantile is not None:
+            delay = self.metrics.latency_quantile(
+                endpoint, self.hedge_quantile, min_samples=self.HEDGE_MIN_SAMPLES
+            )
+        if delay is None:
+            return func(*args, **kwargs)
+
+        pending = {_run_in_thread(func, *args, **kwargs)}
+        done, pending = wait(pending, timeout=delay)
+        hedge = None
+        if not done and self._hedge_slots.acquire(blocking=False):
+
+            def hedged_call():
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._hedge_slots.release()
+
+            hedge = _run_in_thread(hedged_call)
+            pending.add(hedge)
+        error = None
+        while True:
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                if hedge is not None:
+                    self.metrics.record(
+                        {
+                            "type": "hedge",
+                            "endpoint": endpoint,
+                            "delay": delay,
+                            "won": future is hedge,
+                        }
+                    )
+                return result
+            if not pending:
+                raise error
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    @staticmethod
+    def build_base_url(hostname: str, ver: str) -> str:
+        """Builds the base URL of the API, defaulting to https.
+
+        Args:
+            hostname (str): hostname of the API, optionally prefixed with a scheme.
+            ver (str): version of the API.
+
+        Returns:
+            str: base URL of the API.
+        """
+        if "://" not in hostname:
+            hostname = "https://{}".format(hostname)
+        return "{}/{}".format(hostname, ver)
+
+    # utility for bulk requests
+    @staticmethod
+    def map_concurrent(
+        func: Callable,
+        items: list,
+        max_workers: int = 8,
+        retry: Callable[[Exception, int], Union[float, None]] = None,
+    ) -> Tuple[list, dict]:
+        """Calls func on every item using a bounded pool of worker threads.
+
+        Args:
+            func (Callable): function to call with a single item.
+            items (list): items to call func on.
+            max_workers (int, optional): maximum number of concurrent calls. Defaults to 8.
+            retry (Callable, optional): called with the exception and the number of attempts
+                of a failed call, returns the delay in seconds before the item is submitted
+                again or None to give up. Waiting items are kept in a delay queue, so they do
+                not hold a worker. Defaults to None (no retries).
+
+        Returns:
+            Tuple[list, dict]: results of the successful calls in the order of items
+                and a dictionary mapping each failed item to the raised exception.
+        """
+        items = list(items)
+        results = {}
+        failures = {}
+        attempts = [0] * len(items)
+        delayed = []  # heap of (due time, index)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor, tqdm.tqdm(
+            total=len(items)
+        ) as progress:
+            futures = {
+                executor.submit(func, item): index for index, item in enumerate(items)
+            }
+            while futures or delayed:
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now:
+                    _, index = heapq.heappop(delayed)
+                    futures[executor.submit(func, items[index])] = index
+                timeout = delayed[0][0] - now if delayed else None
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        attempts[index] += 1
+                        delay = retry(e, attempts[index]) if retry is not None else None
+                        if delay is not None:
+                            heapq.heappush(delayed, (time.monotonic() + delay, index))
+                            continue
+                        failures[items[index]] = e
+                    progress.update()
+        return [results[index] for index in sorted(results)], failures
+
+    def _map_with_retries(
+        self, func: Callable, items: list, max_workers: int = 8
+    ) -> Tuple[list, dict]:
+        """.map_concurrent() for API calls: instead of sleeping in a worker thread between
+        attempts (see .retry_api_call()), failed calls wait in the delay queue while the
+        other items keep being fetched.
+        """
+
+        def call_once(item):
+            self._retry_state.deferred = True
+            try:
+                return func(item)
+            finally:
+                self._retry_state.deferred = False
+
+        def retry(error, attempt):
+            print(f"Attempt {attempt} failed with error: {error}")
+            return self._retry_delay(func.__name__, error, attempt)
+
+        return self.map_concurrent(call_once, items, max_workers, retry=retry)
+
+    @staticmethod
+    def compact_dataframe(
+        df: pd.DataFrame, max_category_ratio: float = 0.5
+    ) -> pd.DataFrame:
+        """Converts columns to memory efficient dtypes.
+        String columns with few distinct values become categoricals and the other string
+        columns Arrow-backed strings (if pyarrow is installed). Integer columns (IDs, years)
+        become the narrowest nullable integer type. Columns of lists or dictionaries are kept.
+
+        Args:
+            df (pd.DataFrame): dataframe to compact.
+            max_category_ratio (float, optional): Maximum ratio of distinct values to rows
+                for a string column to become categorical. Defaults to 0.5.
+
+        Returns:
+            pd.DataFrame: compacted copy of df.
+        """
+        if importlib.util.find_spec("pyarrow") is not None:
+            string_dtype = pd.StringDtype("pyarrow")
+        else:
+            string_dtype = pd.StringDtype()
+        dtypes = {}
+        for column in df.columns:
+            values = df[column]
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind == "string":
+                if values.nunique() <= max_category_ratio * len(values):
+                    dtypes[column] = "category"
+                else:
+                    dtypes[column] = string_dtype
+            elif kind == "integer" and values.notna().any():
+                low, high = values.min(), values.max()
+                for dtype in ("Int8", "Int16", "Int32", "Int64"):
+                    info = np.iinfo(dtype.lower())
+                    if info.min <= low and high <= info.max:
+                        dtypes[column] = dtype
+                        break
+        return df.astype(dtypes)
 
     # utility for list endpoints
     @staticmethod
@@ -121,14 +738,42 @@ class DRHWrapper:
                     )
         return date_value
 
+    # utility for list endpoints
+    @classmethod
+    def build_list_params(cls, available_params: list, **kwargs) -> dict:
+        """Builds query parameters for a list endpoint.
+
+        Args:
+            available_params (list): Specific parameters available for the endpoint.
+            **kwargs: Parameters detailed in `list_information`.
+
+        Returns:
+            dict: query parameters.
+        """
+        params = {"limit": 25}  # Default parameters
+
+        for key, value in kwargs.items():
+            if value is not None and key in available_params:
+                if key in ["expert", "created_by", "region", "poll"]:
+                    params[key] = cls.to_comma_separated_string(value)
+                elif key in ["start_date", "end_date"]:
+                    params[key] = cls.format_date(value)
+                else:
+                    params[key] = value
+        return params
+
     # list endpoints
     @retry_api_call
-    def list_information(self, endpoint: str, available_params: list, **kwargs) -> dict:
+    def list_information(
+        self, endpoint: str, available_params: list, refresh=False, **kwargs
+    ) -> dict:
         """General method to fetch information, configurable with parameters.
 
         Args:
             endpoint (str): API endpoint to fetch information from.
             available_params (list): Specific parameters available for the endpoint.
+            refresh (bool, optional): Revalidate a cached response with the API even if it
+                is still fresh. Defaults to False.
             **kwargs: Additional parameters to filter the information.
                 - expert: <list[int] | str> A list of expert IDs or a comma-separated string of expert IDs.
                 - poll: <list[int] | str> A list of poll IDs or a comma-separated string of poll IDs.
@@ -145,23 +790,60 @@ class DRHWrapper:
             dict: Dictionary containing the API response.
         """
 
-        params = {"limit": 25}  # Default parameters
+        params = self.build_list_params(available_params, **kwargs)
+        return self._get_json(endpoint, params=params, refresh=refresh)
 
-        for key, value in kwargs.items():
-            if value is not None and key in available_params:
-                if key in ["expert", "created_by", "region", "poll"]:
-                    params[key] = self.to_comma_separated_string(value)
-                elif key in ["start_date", "end_date"]:
-                    params[key] = self.format_date(value)
-                else:
-                    params[key] = value
+    def list_all_information(
+        self, endpoint: str, available_params: list, max_workers=4, **kwargs
+    ) -> dict:
+        """Fetches all pages of a list endpoint concurrently.
+        The first page gives the total `count` and the page size of the server (which may cap
+        `limit`), from which all remaining offsets are requested at once (bounded by
+        max_workers) and concatenated in order.
 
-        response = requests.get(
-            url=os.path.join(self.base_url, endpoint), params=params
-        )
-        return response.json()
+        Args:
+            endpoint (str): API endpoint to fetch information from.
+            available_params (list): Specific parameters available for the endpoint.
+            max_workers (int, optional): Maximum number of pages fetched at once. Defaults to 4.
+            **kwargs: Parameters detailed in `list_information`.
 
-    def list_entries(self, to_dataframe=True, **kwargs):
+        Returns:
+            dict: Dictionary in the format of the API response containing all results.
+        """
+        first_page = self.list_information(endpoint, available_params, **kwargs)
+        offset = kwargs.get("offset") or 0
+        page_size = len(first_page["results"])
+        offsets = []
+        if first_page.get("next") and page_size:
+            offsets = range(offset + page_size, first_page["count"], page_size)
+
+        def fetch_page(page_offset):
+            page_kwargs = dict(kwargs, offset=page_offset)
+            return self.list_information(endpoint, available_params, **page_kwargs)
+
+        pages, failures = self._map_with_retries(fetch_page, offsets, max_workers)
+        if failures:
+            raise next(iter(failures.values()))
+
+        results = list(first_page["results"])
+        for page in pages:
+            results.extend(page["results"])
+        expected = max(0, first_page["count"] - offset)
+        if len(results) != expected:
+            raise ValueError(
+                f"Expected {expected} {endpoint} results, got {len(results)} "
+                "(did the data change while paging?)"
+            )
+        return {
+            "count": first_page["count"],
+            "next": None,
+            "previous": first_page.get("previous"),
+            "results": results,
+        }
+
+    def list_entries(
+        self, to_dataframe=True, all_pages=False, max_workers=4, compact=False, **kwargs
+    ):
         """Fetches entries. This method supports parameters detailed in `list_information`.
         Includes additional parameters:
         - expert: <list[int] | str> A list of expert IDs or a comma-separated string of expert IDs.
@@ -170,49 +852,61 @@ class DRHWrapper:
 
         Args:
             to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+            all_pages (bool, optional): Fetch all pages (from offset) concurrently. Defaults to False.
+            max_workers (int, optional): Maximum number of pages fetched at once with all_pages. Defaults to 4.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe()).
+                Defaults to False.
 
         Returns:
             pd.DataFrame: Dataframe with entries.
         """
-        available_params = [
-            "expert",
-            "start_date",
-            "end_date",
-            "limit",
-            "offset",
-            "ordering",
-            "region",
-            "poll",
-        ]
-        entry_information = self.list_information("entries", available_params, **kwargs)
+        if all_pages:
+            entry_information = self.list_all_information(
+                "entries", self.ENTRY_PARAMS, max_workers, **kwargs
+            )
+        else:
+            entry_information = self.list_information(
+                "entries", self.ENTRY_PARAMS, **kwargs
+            )
         if to_dataframe:
-            entry_information = self.list_entries_to_dataframe(entry_information)
+            entry_information = self._parse(
+                self.list_entries_to_dataframe, entry_information, compact=compact
+            )
         return entry_information
 
     @staticmethod
-    def list_entries_to_dataframe(entry_dictionary: dict) -> pd.DataFrame:
+    def list_entries_to_dataframe(
+        entry_dictionary: dict, compact=False
+    ) -> pd.DataFrame:
         """Converts entry dictionary to a DataFrame.
 
         Args:
             entry_dictionary (dict): Dictionary obtained from .list_entries() method.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe()).
+                Defaults to False.
 
         Returns:
             pd.DataFrame: Pandas dataframe with entries.
         """
-        entry_dictionary_results = entry_dictionary["results"]
-        entry_df = pd.DataFrame(entry_dictionary_results)
-        entry_df["entry_id"] = entry_df["id"]
-        entry_df["entry_name"] = entry_df["name"].apply(lambda x: x["name"])
-        entry_df["expert_id"] = entry_df["expert"].apply(lambda x: x["id"])
-        entry_df["expert_name"] = entry_df["expert"].apply(
-            lambda x: f"{x['first_name']} {x['last_name']}"
-        )
-        entry_df["poll_id"] = entry_df["poll"].apply(lambda x: x["id"])
-        entry_df["poll_name"] = entry_df["poll"].apply(lambda x: x["name"])
-        entry_df["region_id"] = entry_df["region"].apply(lambda x: x["id"])
-        entry_df["region_name"] = entry_df["region"].apply(lambda x: x["name"])
-        entry_df = entry_df[
-            [
+        columns = DRHWrapper.list_entries_to_columns(entry_dictionary)
+        df = pd.DataFrame(columns)
+        if compact:
+            df = DRHWrapper.compact_dataframe(df)
+        return df
+
+    @staticmethod
+    def list_entries_to_columns(entry_dictionary: dict) -> Dict[str, list]:
+        """Flattens entries from .list_entries() into columns in a single pass.
+
+        Args:
+            entry_dictionary (dict): Dictionary obtained from .list_entries() method.
+
+        Returns:
+            Dict[str, list]: column name to list of values.
+        """
+        columns = {
+            column: []
+            for column in [
                 "entry_id",
                 "entry_name",
                 "expert_id",
@@ -226,10 +920,28 @@ class DRHWrapper:
                 "region_name",
                 "tags",
             ]
-        ]
-        return entry_df
-
-    def list_entry_tags(self, to_dataframe=True, **kwargs):
+        }
+        for entry in entry_dictionary["results"]:
+            expert, poll, region = entry["expert"], entry["poll"], entry["region"]
+            columns["entry_id"].append(entry["id"])
+            columns["entry_name"].append(entry["name"]["name"])
+            columns["expert_id"].append(expert["id"])
+            columns["expert_name"].append(
+                f"{expert['first_name']} {expert['last_name']}"
+            )
+            columns["poll_id"].append(poll["id"])
+            columns["poll_name"].append(poll["name"])
+            columns["date_created"].append(entry["date_created"])
+            columns["year_from"].append(entry["year_from"])
+            columns["year_to"].append(entry["year_to"])
+            columns["region_id"].append(region["id"])
+            columns["region_name"].append(region["name"])
+            columns["tags"].append(entry["tags"])
+        return columns
+
+    def list_entry_tags(
+        self, to_dataframe=True, all_pages=False, max_workers=4, **kwargs
+    ):
         """Fetches entry tags. Supports parameters detailed in `list_information`.
         Includes additional parameters:
         - approved: <bool> Whether to fetch only approved tags.
@@ -237,22 +949,22 @@ class DRHWrapper:
 
         Args:
             to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+            all_pages (bool, optional): Fetch all pages (from offset) concurrently. Defaults to False.
+            max_workers (int, optional): Maximum number of pages fetched at once with all_pages. Defaults to 4.
 
         Returns:
             pd.DataFrame: Dataframe with entry tags.
         """
-        available_params = [
-            "approved",
-            "created_by",
-            "start_date",
-            "end_date",
-            "limit",
-            "offset",
-            "ordering",
-        ]
-        entry_tags = self.list_information("entry_tags", available_params, **kwargs)
+        if all_pages:
+            entry_tags = self.list_all_information(
+                "entry_tags", self.ENTRY_TAG_PARAMS, max_workers, **kwargs
+            )
+        else:
+            entry_tags = self.list_information(
+                "entry_tags", self.ENTRY_TAG_PARAMS, **kwargs
+            )
         if to_dataframe:
-            entry_tags = self.list_entry_tags_to_dataframe(entry_tags)
+            entry_tags = self._parse(self.list_entry_tags_to_dataframe, entry_tags)
         return entry_tags
 
     @staticmethod
@@ -265,58 +977,32 @@ class DRHWrapper:
         Returns:
             pd.DataFrame: Dataframe with entry tags.
         """
-        entry_tag_dictionary_results = entry_tag_dictionary["results"]
-        entry_tag_df = pd.DataFrame(entry_tag_dictionary_results)
-        entry_tag_df["entry_tag_id"] = entry_tag_df["id"]
-        entry_tag_df["entry_tag_name"] = entry_tag_df["name"]
-        entry_tag_df["approved"] = entry_tag_df["approved"]
-        entry_tag_df["parent_tag_id"] = entry_tag_df["parent_tag_id"]
-        entry_tag_df["created"] = entry_tag_df["created"]
-        entry_tag_df["created_by_id"] = entry_tag_df["created_by"].apply(
-            lambda x: x["id"]
-        )
-        entry_tag_df["created_by_username"] = entry_tag_df["created_by"].apply(
-            lambda x: x["username"]
-        )
-        entry_tag_df["created_by_name"] = entry_tag_df["created_by"].apply(
-            lambda x: f"{x['first_name']} {x['last_name']}"
-        )
-        entry_tag_df = entry_tag_df[
-            [
-                "entry_tag_id",
-                "entry_tag_name",
-                "approved",
-                "parent_tag_id",
-                "created",
-                "created_by_id",
-                "created_by_username",
-                "created_by_name",
-            ]
-        ]
-        return entry_tag_df
+        columns = DRHWrapper.list_tags_to_columns(entry_tag_dictionary, "entry_tag")
+        return pd.DataFrame(columns)
 
-    def list_regions(self, to_dataframe=True, **kwargs):
+    def list_regions(self, to_dataframe=True, all_pages=False, max_workers=4, **kwargs):
         """Fetches regions from the API. Supports parameters detailed in `list_information`.
 
         Args:
             to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+            all_pages (bool, optional): Fetch all pages (from offset) concurrently. Defaults to False.
+            max_workers (int, optional): Maximum number of pages fetched at once with all_pages. Defaults to 4.
 
         Returns:
             pd.DataFrame: Dataframe with regions.
         """
-        available_params = [
-            "created_by",
-            "start_date",
-            "end_date",
-            "limit",
-            "offset",
-            "ordering",
-        ]
-        region_information = self.list_information(
-            "regions", available_params, **kwargs
-        )
+        if all_pages:
+            region_information = self.list_all_information(
+                "regions", self.REGION_PARAMS, max_workers, **kwargs
+            )
+        else:
+            region_information = self.list_information(
+                "regions", self.REGION_PARAMS, **kwargs
+            )
         if to_dataframe:
-            region_information = self.list_regions_to_dataframe(region_information)
+            region_information = self._parse(
+                self.list_regions_to_dataframe, region_information
+            )
         return region_information
 
     @staticmethod
@@ -329,18 +1015,22 @@ class DRHWrapper:
         Returns:
             pd.DataFrame: Dataframe with regions.
         """
-        region_dictionary_results = region_dictionary["results"]
-        region_df = pd.DataFrame(region_dictionary_results)
-        region_df["region_id"] = region_df["id"]
-        region_df["region_name"] = region_df["name"]
-        region_df["description"] = region_df["description"]
-        region_df["created_by_id"] = region_df["created_by"].apply(lambda x: x["id"])
-        region_df["created_by_name"] = region_df["created_by"].apply(
-            lambda x: f"{x['first_name']} {x['last_name']}"
-        )
-        region_df["geom"] = region_df["geom"].apply(lambda x: x["coordinates"])
-        region_df = region_df[
-            [
+        columns = DRHWrapper.list_regions_to_columns(region_dictionary)
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def list_regions_to_columns(region_dictionary: dict) -> Dict[str, list]:
+        """Flattens regions from .list_regions() into columns in a single pass.
+
+        Args:
+            region_dictionary (dict): dictionary obtained from .list_regions() method.
+
+        Returns:
+            Dict[str, list]: column name to list of values.
+        """
+        columns = {
+            column: []
+            for column in [
                 "region_id",
                 "region_name",
                 "description",
@@ -349,10 +1039,23 @@ class DRHWrapper:
                 "geom",
                 "tags",
             ]
-        ]
-        return region_df
-
-    def list_region_tags(self, to_dataframe=True, **kwargs):
+        }
+        for region in region_dictionary["results"]:
+            created_by = region["created_by"]
+            columns["region_id"].append(region["id"])
+            columns["region_name"].append(region["name"])
+            columns["description"].append(region["description"])
+            columns["created_by_id"].append(created_by["id"])
+            columns["created_by_name"].append(
+                f"{created_by['first_name']} {created_by['last_name']}"
+            )
+            columns["geom"].append(region["geom"]["coordinates"])
+            columns["tags"].append(region["tags"])
+        return columns
+
+    def list_region_tags(
+        self, to_dataframe=True, all_pages=False, max_workers=4, **kwargs
+    ):
         """Fetches region tags from the API. Supports parameters detailed in `list_information`.
         Includes additional parameters:
         - approved: <bool> Whether to fetch only approved tags.
@@ -360,24 +1063,23 @@ class DRHWrapper:
 
         Args:
             to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+            all_pages (bool, optional): Fetch all pages (from offset) concurrently. Defaults to False.
+            max_workers (int, optional): Maximum number of pages fetched at once with all_pages. Defaults to 4.
 
         Returns:
             pd.DataFrame: Dataframe with region tags.
         """
 
-        available_params = [
-            "approved",
-            "created_by",
-            "start_date",
-            "end_date",
-            "limit",
-            "offset",
-            "ordering",
-        ]
-
-        region_tags = self.list_information("region_tags", available_params, **kwargs)
+        if all_pages:
+            region_tags = self.list_all_information(
+                "region_tags", self.REGION_TAG_PARAMS, max_workers, **kwargs
+            )
+        else:
+            region_tags = self.list_information(
+                "region_tags", self.REGION_TAG_PARAMS, **kwargs
+            )
         if to_dataframe:
-            region_tags = self.list_region_tags_to_dataframe(region_tags)
+            region_tags = self._parse(self.list_region_tags_to_dataframe, region_tags)
         return region_tags
 
     @staticmethod
@@ -390,35 +1092,186 @@ class DRHWrapper:
         Returns:
             pd.DataFrame: Dataframe with region tags.
         """
-        region_tag_dictionary_results = region_tag_dictionary["results"]
-        region_tag_df = pd.DataFrame(region_tag_dictionary_results)
-        region_tag_df["region_tag_id"] = region_tag_df["id"]
-        region_tag_df["region_tag_name"] = region_tag_df["name"]
-        region_tag_df["approved"] = region_tag_df["approved"]
-        region_tag_df["parent_tag_id"] = region_tag_df["parent_tag_id"]
-        region_tag_df["created"] = region_tag_df["created"]
-        region_tag_df["created_by_id"] = region_tag_df["created_by"].apply(
-            lambda x: x["id"]
+        columns = DRHWrapper.list_tags_to_columns(region_tag_dictionary, "region_tag")
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def list_tags_to_columns(tag_dictionary: dict, prefix: str) -> Dict[str, list]:
+        """Flattens entry or region tags into columns in a single pass.
+
+        Args:
+            tag_dictionary (dict): dictionary obtained from .list_entry_tags() or .list_region_tags() method.
+            prefix (str): prefix of the ID and name columns ("entry_tag" or "region_tag").
+
+        Returns:
+            Dict[str, list]: column name to list of values.
+        """
+        tag_id, tag_name = [], []
+        columns = {
+            f"{prefix}_id": tag_id,
+            f"{prefix}_name": tag_name,
+            "approved": [],
+            "parent_tag_id": [],
+            "created": [],
+            "created_by_id": [],
+            "created_by_username": [],
+            "created_by_name": [],
+        }
+        for tag in tag_dictionary["results"]:
+            created_by = tag["created_by"]
+            tag_id.append(tag["id"])
+            tag_name.append(tag["name"])
+            columns["approved"].append(tag["approved"])
+            columns["parent_tag_id"].append(tag["parent_tag_id"])
+            columns["created"].append(tag["created"])
+            columns["created_by_id"].append(created_by["id"])
+            columns["created_by_username"].append(created_by["username"])
+            columns["created_by_name"].append(
+                f"{created_by['first_name']} {created_by['last_name']}"
+            )
+        return columns
+
+    # pagination for list endpoints
+    @staticmethod
+    def next_page_params(page: dict, params: dict) -> Union[dict, None]:
+        """Parameters for the page following `page`, taken from its `next` link.
+
+        Args:
+            page (dict): Page returned by the .list_information() method.
+            params (dict): Parameters used to request `page`.
+
+        Returns:
+            Union[dict, None]: Parameters for the next page (None on the last page).
+        """
+        if not page.get("next"):
+            return None
+        query = parse_qs(urlparse(page["next"]).query)
+        next_params = dict(params)
+        for key in ["limit", "offset"]:
+            if key in query:
+                next_params[key] = int(query[key][0])
+        return next_params
+
+    def iter_information(
+        self, endpoint: str, available_params: list, prefetch=False, **kwargs
+    ) -> Iterator[dict]:
+        """Iterates over all pages of a list endpoint by following the `next` links.
+
+        Args:
+            endpoint (str): API endpoint to fetch information from.
+            available_params (list): Specific parameters available for the endpoint.
+            prefetch (bool, optional): Fetch the next page while the current one is
+                being consumed. Defaults to False.
+            **kwargs: Parameters detailed in `list_information`.
+
+        Yields:
+            dict: Dictionary containing the API response for each page.
+        """
+        page = self.list_information(endpoint, available_params, **kwargs)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                next_params = self.next_page_params(page, kwargs)
+                if next_params is not None and prefetch:
+                    next_page = executor.submit(
+                        self.list_information,
+                        endpoint,
+                        available_params,
+                        **next_params,
+                    )
+                yield page
+                if next_params is None:
+                    break
+                if prefetch:
+                    page = next_page.result()
+                else:
+                    page = self.list_information(
+                        endpoint, available_params, **next_params
+                    )
+                kwargs = next_params
+
+    def _iter_pages(self, pages, to_dataframe, rows, converter):
+        """Converts pages from .iter_information() to DataFrames or single results."""
+        for page in pages:
+            if not page["results"]:
+                continue
+            if rows:
+                yield from page["results"]
+            elif to_dataframe:
+                yield converter(page)
+            else:
+                yield page
+
+    def iter_entries(self, to_dataframe=True, rows=False, prefetch=False, **kwargs):
+        """Iterates over all entries page by page. Supports parameters detailed in `list_entries`.
+
+        Args:
+            to_dataframe (bool, optional): Yield pages as pandas dataframes. Defaults to True.
+            rows (bool, optional): Yield single entries (dictionaries) instead of pages. Defaults to False.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed. Defaults to False.
+
+        Yields:
+            pd.DataFrame: Dataframe with a page of entries.
+        """
+        pages = self.iter_information(
+            "entries", self.ENTRY_PARAMS, prefetch=prefetch, **kwargs
         )
-        region_tag_df["created_by_username"] = region_tag_df["created_by"].apply(
-            lambda x: x["username"]
+        return self._iter_pages(
+            pages, to_dataframe, rows, self.list_entries_to_dataframe
         )
-        region_tag_df["created_by_name"] = region_tag_df["created_by"].apply(
-            lambda x: f"{x['first_name']} {x['last_name']}"
+
+    def iter_entry_tags(self, to_dataframe=True, rows=False, prefetch=False, **kwargs):
+        """Iterates over all entry tags page by page. Supports parameters detailed in `list_entry_tags`.
+
+        Args:
+            to_dataframe (bool, optional): Yield pages as pandas dataframes. Defaults to True.
+            rows (bool, optional): Yield single entry tags (dictionaries) instead of pages. Defaults to False.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed. Defaults to False.
+
+        Yields:
+            pd.DataFrame: Dataframe with a page of entry tags.
+        """
+        pages = self.iter_information(
+            "entry_tags", self.ENTRY_TAG_PARAMS, prefetch=prefetch, **kwargs
+        )
+        return self._iter_pages(
+            pages, to_dataframe, rows, self.list_entry_tags_to_dataframe
+        )
+
+    def iter_regions(self, to_dataframe=True, rows=False, prefetch=False, **kwargs):
+        """Iterates over all regions page by page. Supports parameters detailed in `list_regions`.
+
+        Args:
+            to_dataframe (bool, optional): Yield pages as pandas dataframes. Defaults to True.
+            rows (bool, optional): Yield single regions (dictionaries) instead of pages. Defaults to False.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed. Defaults to False.
+
+        Yields:
+            pd.DataFrame: Dataframe with a page of regions.
+        """
+        pages = self.iter_information(
+            "regions", self.REGION_PARAMS, prefetch=prefetch, **kwargs
+        )
+        return self._iter_pages(
+            pages, to_dataframe, rows, self.list_regions_to_dataframe
+        )
+
+    def iter_region_tags(self, to_dataframe=True, rows=False, prefetch=False, **kwargs):
+        """Iterates over all region tags page by page. Supports parameters detailed in `list_region_tags`.
+
+        Args:
+            to_dataframe (bool, optional): Yield pages as pandas dataframes. Defaults to True.
+            rows (bool, optional): Yield single region tags (dictionaries) instead of pages. Defaults to False.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed. Defaults to False.
+
+        Yields:
+            pd.DataFrame: Dataframe with a page of region tags.
+        """
+        pages = self.iter_information(
+            "region_tags", self.REGION_TAG_PARAMS, prefetch=prefetch, **kwargs
+        )
+        return self._iter_pages(
+            pages, to_dataframe, rows, self.list_region_tags_to_dataframe
         )
-        region_tag_df = region_tag_df[
-            [
-                "region_tag_id",
-                "region_tag_name",
-                "approved",
-                "parent_tag_id",
-                "created",
-                "created_by_id",
-                "created_by_username",
-                "created_by_name",
-            ]
-        ]
-        return region_tag_df
 
     # questionrelation endpoint
     def get_related_questions(self, to_dataframe=True, simplify=True):
@@ -435,8 +1288,7 @@ class DRHWrapper:
             pd.DataFrame: Dataframe with question ID (primary key) and related question ID.
         """
 
-        response = requests.get(url=os.path.join(self.base_url, "questionrelation"))
-        questionrelation_json = response.json()
+        questionrelation_json = self._get_json("questionrelation")
 
         # If not to_dataframe we just return
         if not to_dataframe:
@@ -447,7 +1299,15 @@ class DRHWrapper:
 
         if not simplify:
             return questionrelation_df
-        return self.simplify_question_relations(questionrelation_df)
+        return self._parse(self.simplify_question_relations, questionrelation_df)
+
+    def get_question_index(self) -> QuestionIndex:
+        """Get an index of related questions from the API.
+
+        Returns:
+            QuestionIndex: maps question IDs to the lowest question ID within their group.
+        """
+        return QuestionIndex.from_relations(self.get_related_questions())
 
     @staticmethod
     def simplify_question_relations(questionrelation_df: pd.DataFrame) -> pd.DataFrame:
@@ -468,56 +1328,140 @@ class DRHWrapper:
             }
         )
 
-        # Build graph
-        G = nx.Graph()
-        for _, row in questionrelation_df.iterrows():
-            G.add_edge(row["question_id"], row["related_question_id"])
+        # Map question IDs to dense indices (sorted, so the smallest index is the smallest ID)
+        first_ids = questionrelation_df["question_id"].to_numpy()
+        second_ids = questionrelation_df["related_question_id"].to_numpy()
+        question_ids, edges = np.unique(
+            np.concatenate([first_ids, second_ids]), return_inverse=True
+        )
+        first, second = edges[: len(first_ids)], edges[len(first_ids) :]
+
+        # Connected components (union-find): hook the larger root of every edge that still
+        # connects two trees onto the smaller one, then compress paths until every question
+        # points at its root, which is the smallest question of its component
+        labels = np.arange(len(question_ids))
+        while len(first):
+            first_roots, second_roots = labels[first], labels[second]
+            crossing = first_roots != second_roots
+            first, second = first[crossing], second[crossing]
+            first_roots, second_roots = first_roots[crossing], second_roots[crossing]
+            np.minimum.at(
+                labels,
+                np.maximum(first_roots, second_roots),
+                np.minimum(first_roots, second_roots),
+            )
+            while True:
+                grandparents = labels[labels]
+                if np.array_equal(grandparents, labels):
+                    break
+                labels = grandparents
+
+        related_question_ids = question_ids[labels]
+        order = np.lexsort((question_ids, related_question_ids))
+        questionrelation_df = pd.DataFrame(
+            {
+                "question_id": question_ids[order],
+                "related_question_id": related_question_ids[order],
+            }
+        )
+        return questionrelation_df
 
-        # Find connected components
-        connected_components = list(nx.connected_components(G))
+    # find endpoints
+    def find_information(
+        self, endpoint: str, id: Union[int, str], refresh=False
+    ) -> Dict:
+        """Fetches a single piece of information from the API.
+        Served from the in-memory LRU cache when find_cache_size > 0.
 
-        # Create a new DataFrame for the output with the smallest question_id in each component as the related_question_id
-        new_labels = []
-        for component in connected_components:
-            min_question_id = min(
-                component
-            )  # Find the minimum question_id in the current component
-            for question_id in component:
-                new_labels.append(
-                    {"question_id": question_id, "related_question_id": min_question_id}
-                )
+        Args:
+            endpoint (str): Specific API endpoint to fetch information from.
+            id (Union[int, str]): ID of the information to fetch
+            refresh (bool, optional): Fetch it from the API (revalidating the response
+                cache) and update the in-memory cache. Defaults to False.
 
-        questionrelation_df = pd.DataFrame(new_labels)
-        questionrelation_df = questionrelation_df.sort_values(
-            by=["related_question_id", "question_id"]
-        ).reset_index(drop=True)
-        return questionrelation_df
+        Returns:
+            Dict: Dictionary containing the API response.
+        """
+        if self.find_cache_size <= 0:
+            return self.fetch_information(endpoint, id, refresh)
+
+        key = (endpoint, str(id))
+        with self._find_cache_lock:
+            if key in self._find_cache and not refresh:
+                self._find_cache.move_to_end(key)
+                self._find_cache_hits += 1
+                information = self._find_cache[key]
+            else:
+                information = None
+                self._find_cache_misses += 1
+        if information is not None:
+            self._record_cache(endpoint, "find", "hit")
+            return information
+        self._record_cache(endpoint, "find", "miss")
+
+        information = self.fetch_information(endpoint, id, refresh)
+        with self._find_cache_lock:
+            self._find_cache[key] = information
+            self._find_cache.move_to_end(key)
+            while len(self._find_cache) > self.find_cache_size:
+                self._find_cache.popitem(last=False)
+        return information
 
-    # find endpoints
     @retry_api_call
-    def find_information(self, endpoint: str, id: Union[int, str]) -> Dict:
-        """Fetches a single piece of information from the API.
+    def fetch_information(
+        self, endpoint: str, id: Union[int, str], refresh=False
+    ) -> Dict:
+        """Fetches a single piece of information from the API, bypassing the in-memory cache.
 
         Args:
             endpoint (str): Specific API endpoint to fetch information from.
             id (Union[int, str]): ID of the information to fetch
+            refresh (bool, optional): Revalidate a cached response with the API even if it
+                is still fresh. Defaults to False.
 
         Returns:
             Dict: Dictionary containing the API response.
         """
-        response = requests.get(url=os.path.join(self.base_url, endpoint, str(id)))
-        return response.json()
+        return self._hedge(endpoint, self._get_json, endpoint, str(id), refresh=refresh)
+
+    def clear_find_cache(self, endpoint: str = None):
+        """Invalidates the in-memory cache of find_* lookups.
 
-    def find_entry(self, entry_id: Union[int, str]) -> Dict:
+        Args:
+            endpoint (str, optional): Only invalidate this endpoint. Defaults to None (everything).
+        """
+        with self._find_cache_lock:
+            if endpoint is None:
+                self._find_cache.clear()
+            else:
+                for key in [key for key in self._find_cache if key[0] == endpoint]:
+                    del self._find_cache[key]
+
+    def find_cache_info(self) -> dict:
+        """Hit/miss counters and size of the in-memory cache of find_* lookups.
+
+        Returns:
+            dict: `hits`, `misses`, `size` and `capacity`.
+        """
+        with self._find_cache_lock:
+            return {
+                "hits": self._find_cache_hits,
+                "misses": self._find_cache_misses,
+                "size": len(self._find_cache),
+                "capacity": self.find_cache_size,
+            }
+
+    def find_entry(self, entry_id: Union[int, str], refresh=False) -> Dict:
         """Fetches a single entry from the API.
 
         Args:
             entry_id (Union[int, str]): The ID of the entry to fetch.
+            refresh (bool, optional): Bypass the caches (see .find_information()). Defaults to False.
 
         Returns:
             Dict: Dictionary containing the API response.
         """
-        return self.find_information("entries", entry_id)
+        return self.find_information("entries", entry_id, refresh)
 
     def find_entry_tag(self, entry_tag_id: Union[int, str]) -> Dict:
         """Fetches a single entry tag from the API.
@@ -553,120 +1497,393 @@ class DRHWrapper:
         return self.find_information("region_tags", region_tag_id)
 
     @staticmethod
-    def extract_answerset(response_json: dict) -> pd.DataFrame:
+    def extract_answerset(response_json: dict, compact=False) -> pd.DataFrame:
         """Extract answerset from a JSON response from the .get_answerset() method.
 
         Args:
             response_json (dict): API response from the .get_answerset() method.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe()).
+                Defaults to False.
 
         Returns:
             pd.DataFrame: Dataframe with answerset information.
         """
-        information = []
+        columns = {column: [] for column in ANSWERSET_COLUMNS}
         for json_entry in response_json:
-            entry_id = json_entry["id"]
-            entry_name = json_entry["title"]
-            date_created = json_entry["date_created"]
-            poll_id = json_entry["poll"]["id"]
-            poll_name = json_entry["poll"]["name"]
-            question_id = json_entry["question_id"]
-            for answer in json_entry["answers"]:
-                answer_name = answer["name"]
-                answer_value = answer["value"]
-                year_from = answer["year_from"]
-                year_to = answer["year_to"]
-                expert_id = answer["expert"]["expert_id"]
-                expert_name = (
-                    answer["expert"]["first_name"] + " " + answer["expert"]["last_name"]
-                )
-                region_id = answer["region_id"]
-                status_participants = answer["status_of_participants"]["name"]
-                information.append(
-                    [
-                        entry_id,
-                        entry_name,
-                        poll_id,
-                        poll_name,
-                        question_id,
-                        answer_name,
-                        answer_value,
-                        year_from,
-                        year_to,
-                        region_id,
-                        status_participants,
-                        expert_id,
-                        expert_name,
-                        date_created,
-                    ]
-                )
-        df = pd.DataFrame(
-            information,
-            columns=[
-                "entry_id",
-                "entry_name",
-                "poll_id",
-                "poll_name",
-                "question_id",
-                "answer_name",
-                "answer_value",
-                "year_from",
-                "year_to",
-                "region_id",
-                "status_participants",
-                "expert_id",
-                "expert_name",
-                "date_created",
-            ],
-        )
+            DRHWrapper.extract_answerset_columns(columns, json_entry)
+        df = DRHWrapper.answerset_columns_to_dataframe(columns)
+        if compact:
+            df = DRHWrapper.compact_dataframe(df)
         return df
 
+    @staticmethod
+    def extract_answerset_columns(columns: Dict[str, list], json_entry: dict):
+        """Appends the answers of one entry of an answerset to columns (ANSWERSET_COLUMNS).
+
+        Args:
+            columns (Dict[str, list]): column name to list of values, filled in place.
+            json_entry (dict): one entry of the .get_answerset() API response.
+        """
+        entry_id = json_entry["id"]
+        entry_name = json_entry["title"]
+        date_created = json_entry["date_created"]
+        poll_id = json_entry["poll"]["id"]
+        poll_name = json_entry["poll"]["name"]
+        question_id = json_entry["question_id"]
+        for answer in json_entry["answers"]:
+            expert = answer["expert"]
+            columns["entry_id"].append(entry_id)
+            columns["entry_name"].append(entry_name)
+            columns["poll_id"].append(poll_id)
+            columns["poll_name"].append(poll_name)
+            columns["question_id"].append(question_id)
+            columns["answer_name"].append(answer["name"])
+            columns["answer_value"].append(answer["value"])
+            columns["year_from"].append(answer["year_from"])
+            columns["year_to"].append(answer["year_to"])
+            columns["region_id"].append(answer["region_id"])
+            columns["status_participants"].append(
+                answer["status_of_participants"]["name"]
+            )
+            columns["expert_id"].append(expert["expert_id"])
+            columns["expert_name"].append(
+                expert["first_name"] + " " + expert["last_name"]
+            )
+            columns["date_created"].append(date_created)
+
+    @staticmethod
+    def answerset_columns_to_dataframe(columns: Dict[str, list]) -> pd.DataFrame:
+        """Builds the answerset DataFrame from columns filled by .extract_answerset_columns().
+
+        Args:
+            columns (Dict[str, list]): column name (ANSWERSET_COLUMNS) to list of values.
+
+        Returns:
+            pd.DataFrame: Dataframe with answerset information.
+        """
+        # empty columns stay object dtype
+        if not columns["entry_id"]:
+            return pd.DataFrame([], columns=ANSWERSET_COLUMNS)
+        return pd.DataFrame(columns)
+
     @retry_api_call
     def get_answerset(
-        self, question_name: str, to_dataframe=True
-    ) -> Union[pd.DataFrame, dict]:
+        self, question_name: str, to_dataframe=True, stream=False, compact=False
+    ) -> Union[pd.DataFrame, List[Dict]]:
         """Extract answerset for a specific question from the API.
 
         Args:
             question_name (str): name of the question to fetch answerset for.
-            to_dataframe (bool, optional): Return as dataframe. Defaults to True.
+            to_dataframe (bool, optional): Return as dataframe, else the raw entries of the
+                API response without touching pandas. Defaults to True.
+            stream (bool, optional): Parse the response incrementally into the dataframe
+                instead of decoding the whole body first (bypasses the response cache).
+                Defaults to False.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe()).
+                Defaults to False.
 
         Returns:
-            Union[pd.DataFrame, dict]: Return as dataframe (if to_dataframe=True) or dictionary.
+            Union[pd.DataFrame, List[Dict]]: Return as dataframe (if to_dataframe=True) or list
+                of entries.
         """
 
-        response = requests.get(
-            url=os.path.join(self.base_url, "entries-by-question"),
+        if stream:
+            # this call is retried as a whole, including failures while reading the body
+            json_entries = self._iter_json_entries(
+                "entries-by-question",
+                params={"question_name": question_name},
+                retry=False,
+            )
+            if not to_dataframe:
+                return list(json_entries)
+            columns = {column: [] for column in ANSWERSET_COLUMNS}
+            for json_entry in json_entries:
+                self.extract_answerset_columns(columns, json_entry)
+            answerset_df = self.answerset_columns_to_dataframe(columns)
+            if compact:
+                answerset_df = self.compact_dataframe(answerset_df)
+            return answerset_df
+
+        answerset_json = self._hedge(
+            "entries-by-question",
+            self._get_json,
+            "entries-by-question",
             params={"question_name": question_name},
         )
-        answerset_json = response.json()
 
         if to_dataframe:
-            answerset_df = self.extract_answerset(answerset_json)
+            answerset_df = self._parse(
+                self.extract_answerset, answerset_json, compact=compact
+            )
             return answerset_df
 
-        return answerset_df
+        return answerset_json
+
+    def iter_answerset(
+        self,
+        question_name: str,
+        to_dataframe=True,
+        chunk_size: int = 1000,
+        compact=False,
+    ) -> Iterator[Union[pd.DataFrame, Dict]]:
+        """Streams the answerset for a specific question from the API.
+        The response body is parsed incrementally, so memory use is bounded by chunk_size
+        rather than by the size of the answerset. Bypasses the response cache.
+
+        Args:
+            question_name (str): name of the question to fetch answerset for.
+            to_dataframe (bool, optional): Yield dataframes (else raw entries). Defaults to True.
+            chunk_size (int, optional): Number of entries per yielded DataFrame. Defaults to 1000.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe())
+                for each chunk. Defaults to False.
+
+        Yields:
+            Union[pd.DataFrame, Dict]: Dataframe of answers for chunk_size entries
+                (same columns as .get_answerset()) or, if to_dataframe=False, one raw entry.
+        """
+        json_entries = self._iter_json_entries(
+            "entries-by-question", params={"question_name": question_name}
+        )
+        if not to_dataframe:
+            yield from json_entries
+            return
+
+        def to_chunk(columns):
+            df = self.answerset_columns_to_dataframe(columns)
+            return self.compact_dataframe(df) if compact else df
+
+        columns = {column: [] for column in ANSWERSET_COLUMNS}
+        n_entries = 0
+        for json_entry in json_entries:
+            self.extract_answerset_columns(columns, json_entry)
+            n_entries += 1
+            if n_entries == chunk_size:
+                yield to_chunk(columns)
+                columns = {column: [] for column in ANSWERSET_COLUMNS}
+                n_entries = 0
+        if n_entries:
+            yield to_chunk(columns)
+
+    def get_answersets(
+        self,
+        question_names: List[str],
+        max_workers: int = 8,
+        return_failures=False,
+        stream=False,
+        to_dataframe=True,
+        compact=False,
+    ) -> Union[pd.DataFrame, Dict[str, List[Dict]], Tuple]:
+        """Fetches the answersets of many questions concurrently into one DataFrame.
+        Each question is fetched with .get_answerset() (and its retries); a failing question
+        does not abort the batch but is reported in the returned failures.
+
+        Args:
+            question_names (List[str]): names of the questions (duplicates are fetched once).
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            return_failures (bool, optional): Also return a dictionary mapping failed question
+                names to the raised exception. Defaults to False.
+            stream (bool, optional): Parse each response incrementally (see .get_answerset()).
+                Defaults to False.
+            to_dataframe (bool, optional): Return one dataframe, else a dictionary mapping each
+                question name to the raw entries of its answerset. Defaults to True.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe())
+                for the combined dataframe. Defaults to False.
+
+        Returns:
+            Union[pd.DataFrame, Dict[str, List[Dict]]]: Dataframe with answerset information
+                (same columns as .get_answerset()) and the requested question_name as first
+                column, in the order of question_names, or the raw answersets by question name.
+        """
+        question_names = list(dict.fromkeys(question_names))
+
+        def get_answerset(question_name):
+            return self.get_answerset(
+                question_name, to_dataframe=to_dataframe, stream=stream
+            )
+
+        answersets, failures = self._map_with_retries(
+            get_answerset,
+            question_names,
+            max_workers,
+        )
+        if failures and not return_failures:
+            print(f"Failed to fetch {len(failures)} answersets: {list(failures)}")
+        names = [name for name in question_names if name not in failures]
+        if to_dataframe:
+            df = self.answersets_to_dataframe(names, answersets)
+            if compact:
+                # after concatenating, as the categories of the answersets differ
+                df = self.compact_dataframe(df)
+        else:
+            df = dict(zip(names, answersets))
+        if return_failures:
+            return df, failures
+        return df
+
+    @staticmethod
+    def answersets_to_dataframe(
+        question_names: List[str], answersets: List[pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Concatenates answersets, tagging each with the name of the requested question.
+
+        Args:
+            question_names (List[str]): question name of each answerset.
+            answersets (List[pd.DataFrame]): answersets from the .get_answerset() method.
+
+        Returns:
+            pd.DataFrame: Dataframe with question_name and the answerset columns.
+        """
+        if not answersets:
+            return pd.DataFrame([], columns=["question_name"] + ANSWERSET_COLUMNS)
+        return pd.concat(
+            [
+                answerset.assign(question_name=question_name)
+                for question_name, answerset in zip(question_names, answersets)
+            ],
+            ignore_index=True,
+        )[["question_name"] + ANSWERSET_COLUMNS]
+
+    def _iter_json_entries(
+        self, *path: str, params: dict = None, retry=True
+    ) -> Iterator:
+        """Streams a GET request returning a JSON array and yields its elements as they are decoded.
+        Opening the stream is retried unless retry=False (for callers that retry as a whole).
+        """
+        if retry:
+            response = self._open_stream_with_retries(*path, params=params)
+        else:
+            response = self._open_stream(*path, params=params)
+        try:
+            yield from _iter_json_array(response.iter_content(chunk_size=64 * 1024))
+        finally:
+            response.close()
+
+    def _open_stream(self, *path: str, params: dict = None) -> requests.Response:
+        """Sends a streaming GET request, failing on error status codes."""
+        return self._send(
+            path[0], os.path.join(self.base_url, *path), params=params, stream=True
+        )
+
+    @retry_api_call
+    def _open_stream_with_retries(
+        self, *path: str, params: dict = None
+    ) -> requests.Response:
+        """Sends a streaming GET request, retrying on errors (see ._open_stream())."""
+        return self._open_stream(*path, params=params)
 
     # bmethods below are related to the endpoint (find_entry) that does not scale well #
-    def dataframe_from_entry_id_list(self, entry_id_list: list) -> pd.DataFrame:
+    def find_entries(
+        self, entry_id_list: list, max_workers: int = 8
+    ) -> Tuple[List[Dict], Dict]:
+        """Fetches many entries from the API concurrently.
+        A failing entry ID does not abort the batch but is reported in the returned failures.
+
+        Args:
+            entry_id_list (list): list of integer (entry IDs)
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+
+        Returns:
+            Tuple[List[Dict], Dict]: Entries in the order of entry_id_list (failed entries omitted)
+                and a dictionary mapping failed entry IDs to the raised exception.
+        """
+        return self._map_with_retries(self.find_entry, entry_id_list, max_workers)
+
+    def iter_find_entries(
+        self,
+        entry_id_list: list,
+        max_workers: int = 8,
+        failures: Dict = None,
+        refresh=False,
+    ) -> Iterator[Dict]:
+        """Fetches entries concurrently and yields them in the order of entry_id_list as they arrive.
+        At most 2 * max_workers entries are fetched ahead of the consumer.
+
+        Args:
+            entry_id_list (list): list of integer (entry IDs)
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            failures (Dict, optional): If given, failed entry IDs are added to it (mapped to the
+                raised exception) instead of being printed.
+            refresh (bool, optional): Bypass the caches (see .find_information()). Defaults to False.
+
+        Yields:
+            Dict: Dictionary containing the API response for each entry.
+        """
+        find_entry = (
+            functools.partial(self.find_entry, refresh=True)
+            if refresh
+            else self.find_entry
+        )
+        entry_ids = iter(entry_id_list)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for entry_id in itertools.islice(entry_ids, 2 * max(1, max_workers)):
+                pending.append((entry_id, executor.submit(find_entry, entry_id)))
+            while pending:
+                entry_id, future = pending.popleft()
+                for next_entry_id in itertools.islice(entry_ids, 1):
+                    pending.append(
+                        (next_entry_id, executor.submit(find_entry, next_entry_id))
+                    )
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    if failures is None:
+                        print(f"Failed to fetch entry {entry_id}: {e}")
+                    else:
+                        failures[entry_id] = e
+                    continue
+                yield entry
+
+    def dataframe_from_entry_id_list(
+        self,
+        entry_id_list: list,
+        max_workers: int = 1,
+        return_failures=False,
+        to_dataframe=True,
+    ) -> Union[pd.DataFrame, List[Dict], Tuple]:
         """Fetches entries from a list of entry IDs and returns them as a DataFrame.
         Unfortunately, the .find_entry() method does not work well for many entries.
-        Consider using the .get_answerset() method instead.
+        Consider using the .get_answerset() method instead, or raise max_workers to fetch
+        entries concurrently.
 
         Args:
             entry_id_list (list): list of integer (entry IDs)
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 1.
+            return_failures (bool, optional): Also return a dictionary mapping failed entry IDs
+                to the raised exception. Defaults to False.
+            to_dataframe (bool, optional): Return as dataframe, else the raw entries (see
+                .find_entries()). Defaults to True.
 
         Returns:
-            pd.DataFrame: Dataframe with entries from search
+            Union[pd.DataFrame, List[Dict]]: Dataframe with entries from search (in the order of
+                entry_id_list) or list of entries.
+        """
+        entry_list, failures = self.find_entries(entry_id_list, max_workers)
+        if failures and not return_failures:
+            print(f"Failed to fetch {len(failures)} entries: {list(failures)}")
+        df = entry_list
+        if to_dataframe:
+            df = self._parse(self.entry_list_to_dataframe, entry_list)
+        if return_failures:
+            return df, failures
+        return df
+
+    @staticmethod
+    def entry_list_to_dataframe(entry_list: List[Dict]) -> pd.DataFrame:
+        """Converts a list of entries from the .find_entry() method to a DataFrame.
+
+        Args:
+            entry_list (List[Dict]): list of entries from the .find_entry() method.
+
+        Returns:
+            pd.DataFrame: Dataframe with entries.
         """
-        entry_list = []
-        for entry_id in tqdm(entry_id_list):
-            entry = self.find_entry(entry_id)  # bottleneck
-            entry_list.append(entry)
         df = pd.DataFrame(entry_list)
 
         df = df.rename(columns={"id": "entry_id"})
         df = df.rename(columns={"name": "entry_name"})
-        df["entry_name"] = df["entry_name"].apply(lambda x: x["name"])
+        if not df.empty:
+            df["entry_name"] = df["entry_name"].apply(lambda x: x["name"])
         return df
 
     @staticmethod
@@ -759,85 +1976,114 @@ class DRHWrapper:
         ].drop_duplicates()
         return df_entries
 
-    def extract_answer_information(self, df_entries: pd.DataFrame) -> pd.DataFrame:
+    def extract_answer_information(
+        self,
+        df_entries: pd.DataFrame,
+        n_workers: int = 1,
+        chunk_size: int = 100,
+        compact=False,
+    ) -> pd.DataFrame:
         """Extract answer information from a DataFrame of entries.
         Dataframe of entries with answersets should be obtained from the .find_entry() method or the .dataframe_from_entry_id_list() method.
 
         Args:
             df_entries (pd.DataFrame): Dataframe of entries with answersets.
+            n_workers (int, optional): Number of processes to extract answers with. Defaults to 1.
+            chunk_size (int, optional): Number of entries per process task. Inputs of at most
+                chunk_size entries are extracted in-process. Defaults to 100.
+            compact (bool, optional): Use memory efficient dtypes (see .compact_dataframe()).
+                Defaults to False.
 
         Returns:
-            pd.DataFrame: Dataframe of answers for entries.
-        """
-        information = []
-        # loop over entries (rows)
-        for _, row in df_entries.iterrows():
-            entry_id = row["entry_id"]
-            entry_name = row["entry_name"]
-            question_sets = row["categories"]
-            # loop over question sets
-            for question_set in question_sets:
-                question_set_id = question_set["id"]  # overall category
-                question_set_name = question_set["name"]  # overall category name
-                questions = question_set["questions"]
-                if questions:
-                    answers = self.extract_answers(
-                        questions,
-                        entry_id,
-                        entry_name,
-                        question_set_id,
-                        question_set_name,
-                        question_group_id=np.nan,
-                        question_group_name=np.nan,
-                    )
-                    information.append(answers)
-                else:
-                    questions_groups = question_set["groups"]
-                    for questions_group in questions_groups:
-                        questions_group_i = questions_group["questions"]
-                        question_group_id = questions_group["id"]
-                        question_group_name = questions_group["name"]
-                        answers = self.extract_answers(
-                            questions_group_i,
-                            entry_id,
-                            entry_name,
-                            question_set_id,
-                            question_set_name,
-                            question_group_id=question_group_id,
-                            question_group_name=question_group_name,
-                        )
-                        information.append(answers)
+            pd.DataFrame: Dataframe of answers for entries (in the order of df_entries).
+        """
+        start = time.perf_counter()
+        entries = list(
+            zip(
+                df_entries["entry_id"],
+                df_entries["entry_name"],
+                df_entries["categories"],
+            )
+        )
+        if n_workers <= 1 or len(entries) <= chunk_size:
+            columns = _extract_shard_columns(entries)
+        else:
+            columns = {column: [] for column in ANSWER_COLUMNS}
+            shards = [
+                (start, min(start + chunk_size, len(entries)))
+                for start in range(0, len(entries), chunk_size)
+            ]
+            # unpickling millions of shard values would otherwise trigger repeated full collections
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    initializer=_init_shard_worker,
+                    initargs=(entries,),
+                ) as executor:
+                    # map preserves the order of the shards
+                    for shard_columns in executor.map(_extract_shard, shards):
+                        for column, values in shard_columns.items():
+                            columns[column].extend(values)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+        df = self.answer_columns_to_dataframe(columns)
+        if compact:
+            df = self.compact_dataframe(df)
+        self.metrics.record(
+            {
+                "type": "parse",
+                "stage": "extract_answer_information",
+                "duration": time.perf_counter() - start,
+                "rows": len(df),
+            }
+        )
+        return df
 
-        # flatten list
-        information = [item for sublist in information for item in sublist]
+    def iter_answer_information(
+        self, entries, chunk_size: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """Extract answer information from raw entries as they arrive, one entry at a time.
+        Entries are dictionaries as returned by the .find_entry() or .iter_find_entries() methods.
 
-        # gather dataframe
-        df = pd.DataFrame(
-            information,
-            columns=[
-                "entry_id",
-                "entry_name",
-                "question_set_id",
-                "question_set_name",
-                "question_group_id",
-                "question_group_name",
-                "question_id",
-                "question_name",
-                "parent_question_id",
-                "answer_set_id",
-                "answer_set_year_from",
-                "answer_set_year_to",
-                "answer_set_region_id",
-                "answer_set_expert_id",
-                "answer_set_status_of_participants_value",
-                "answer_set_status_of_participants_name",
-                "answer_id",
-                "answer_name",
-                "answer_value",
-                "answer_text",
-                "notes",
-            ],
-        )
+        Args:
+            entries (Iterable[Dict]): entries (e.g. a generator) with answersets.
+            chunk_size (int, optional): Number of entries per yielded DataFrame. Defaults to 1.
+
+        Yields:
+            pd.DataFrame: Dataframe of answers for chunk_size entries (same columns as .extract_answer_information()).
+        """
+        columns = {column: [] for column in ANSWER_COLUMNS}
+        n_entries = 0
+        for entry in entries:
+            self.extract_entry_answer_columns(
+                columns, entry["id"], entry["name"]["name"], entry["categories"]
+            )
+            n_entries += 1
+            if n_entries == chunk_size:
+                yield self.answer_columns_to_dataframe(columns)
+                columns = {column: [] for column in ANSWER_COLUMNS}
+                n_entries = 0
+        if n_entries:
+            yield self.answer_columns_to_dataframe(columns)
+
+    @staticmethod
+    def answer_columns_to_dataframe(columns: Dict[str, list]) -> pd.DataFrame:
+        """Builds the answer DataFrame from columns filled by .extract_answer_columns().
+
+        Args:
+            columns (Dict[str, list]): column name (ANSWER_COLUMNS) to list of values.
+
+        Returns:
+            pd.DataFrame: Dataframe of answers.
+        """
+        # gather dataframe column-wise (empty columns stay object dtype)
+        if columns["entry_id"]:
+            df = pd.DataFrame(columns)
+        else:
+            df = pd.DataFrame([], columns=ANSWER_COLUMNS)
 
         # fix introduction of <NA> values
         df["parent_question_id"] = df["parent_question_id"].astype("Int64")
@@ -845,6 +2091,44 @@ class DRHWrapper:
 
         return df
 
+    @staticmethod
+    def extract_entry_answer_columns(
+        columns: Dict[str, list], entry_id, entry_name, question_sets: List[Dict]
+    ):
+        """
+        Helper function for "extract_answer_information". Appends the answers of all question sets
+        (categories) of one entry to columns.
+        """
+        # loop over question sets
+        for question_set in question_sets:
+            question_set_id = question_set["id"]  # overall category
+            question_set_name = question_set["name"]  # overall category name
+            questions = question_set["questions"]
+            if questions:
+                DRHWrapper.extract_answer_columns(
+                    columns,
+                    questions,
+                    entry_id,
+                    entry_name,
+                    question_set_id,
+                    question_set_name,
+                    question_group_id=np.nan,
+                    question_group_name=np.nan,
+                )
+            else:
+                questions_groups = question_set["groups"]
+                for questions_group in questions_groups:
+                    DRHWrapper.extract_answer_columns(
+                        columns,
+                        questions_group["questions"],
+                        entry_id,
+                        entry_name,
+                        question_set_id,
+                        question_set_name,
+                        question_group_id=questions_group["id"],
+                        question_group_name=questions_group["name"],
+                    )
+
     @staticmethod
     def extract_answers(
         answer_dictionary,
@@ -857,95 +2141,312 @@ class DRHWrapper:
     ):
         """
         Helper function for "extract_answer_information". Extracts answers from a dictionary of questions.
+        Returns one list per answer with values in the order of ANSWER_COLUMNS.
         """
-        information = []
-        recode_complexity = {
-            0: "Elite",
-            1: "Religious Specialists",
-            2: "Non-elite (common people, general populace)",
-        }
-
-        def extract_question_data(question, contextual_data, parent_question_id=None):
-            question_id = question["id"]
-            question_name = question["name"]
-            answer_sets = question["answer_sets"]
-
-            for answer_set in answer_sets:
-                answer_set_id = answer_set["id"]
-                answer_set_year_from = answer_set["year_from"]
-                answer_set_year_to = answer_set["year_to"]
-                answer_set_region_id = answer_set["region_id"]
-                answer_set_expert_id = answer_set["expert_id"]
-                answer_set_status_participants_value = answer_set[
-                    "status_of_participants"
-                ]
-                answer_set_status_participants_name = [
-                    recode_complexity[x] for x in answer_set_status_participants_value
-                ]
-                answers = answer_set["answers"]
-                notes = answer_set["notes"]
-
-                for answer in answers:
-                    answer_id = answer["id"]
-                    answer_name = answer["name"]
-                    answer_value = answer["value"]
-                    answer_text = answer["text_input"]
-                    answer_sub_questions = answer["sub_questions"]
-
-                    # Compile all relevant information for this answer
-                    current_data = [
-                        entry_id,
-                        entry_name,
-                        question_set_id,
-                        question_set_name,
-                        question_group_id,
-                        question_group_name,
-                        question_id,
-                        question_name,
-                        parent_question_id,
-                        answer_set_id,
-                        answer_set_year_from,
-                        answer_set_year_to,
-                        answer_set_region_id,
-                        answer_set_expert_id,
-                        answer_set_status_participants_value,
-                        answer_set_status_participants_name,
-                        answer_id,
-                        answer_name,
-                        answer_value,
-                        answer_text,
-                        notes,
-                    ]
-
-                    # Add this answer's data to the overall information
-                    information.append(current_data)
-
-                    # This fixes a problem with duplication that we should not actually have
-                    seen_ids = set()
-                    unique_sub_questions = []
-                    for sub_question in answer_sub_questions:
-                        if sub_question["id"] not in seen_ids:
-                            seen_ids.add(sub_question["id"])
-                            unique_sub_questions.append(sub_question)
-
-                    # Recursively handle sub-questions, if any, passing current question ID as the parent ID
-                    for sub_question in unique_sub_questions:
-                        extract_question_data(
-                            sub_question, contextual_data, question_id
-                        )
-
-        # Initial contextual data for top-level questions
-        contextual_data = [
+        columns = {column: [] for column in ANSWER_COLUMNS}
+        DRHWrapper.extract_answer_columns(
+            columns,
+            answer_dictionary,
             entry_id,
             entry_name,
             question_set_id,
             question_set_name,
             question_group_id,
             question_group_name,
-        ]
+        )
+        return [list(row) for row in zip(*columns.values())]
 
-        # Start processing each top-level question
-        for question in answer_dictionary:
-            extract_question_data(question, contextual_data)
+    @staticmethod
+    def extract_answer_columns(
+        columns,
+        answer_dictionary,
+        entry_id,
+        entry_name,
+        question_set_id,
+        question_set_name,
+        question_group_id,
+        question_group_name,
+    ):
+        """
+        Helper function for "extract_answer_information". Appends answers from a dictionary of questions
+        (including sub-questions, depth first) to columns, a dictionary of lists keyed by ANSWER_COLUMNS.
+        """
+        (
+            entry_ids,
+            entry_names,
+            question_set_ids,
+            question_set_names,
+            question_group_ids,
+            question_group_names,
+            question_ids,
+            question_names,
+            parent_question_ids,
+            answer_set_ids,
+            answer_set_years_from,
+            answer_set_years_to,
+            answer_set_region_ids,
+            answer_set_expert_ids,
+            answer_set_status_participants_values,
+            answer_set_status_participants_names,
+            answer_ids,
+            answer_names,
+            answer_values,
+            answer_texts,
+            notes,
+        ) = [columns[column] for column in ANSWER_COLUMNS]
+
+        # explicit stack instead of recursion. Questions are expanded into their answers;
+        # the sub-questions of an answer are pushed on top, so they are processed right
+        # after the answer and before the next answer of the same question.
+        stack = [(QUESTION, question, None) for question in reversed(answer_dictionary)]
+        while stack:
+            item = stack.pop()
+            if item[0] is QUESTION:
+                _, question, parent_question_id = item
+                question_context = (
+                    question["id"],
+                    _intern(question["name"]),
+                    parent_question_id,
+                )
+                answer_items = []
+                for answer_set in question["answer_sets"]:
+                    status_participants_value = answer_set["status_of_participants"]
+                    answer_set_context = (
+                        answer_set["id"],
+                        answer_set["year_from"],
+                        answer_set["year_to"],
+                        answer_set["region_id"],
+                        answer_set["expert_id"],
+                        status_participants_value,
+                        [RECODE_COMPLEXITY[x] for x in status_participants_value],
+                        answer_set["notes"],
+                    )
+                    for answer in answer_set["answers"]:
+                        answer_items.append(
+                            (question_context, answer_set_context, answer)
+                        )
+                stack.extend(reversed(answer_items))
+                continue
+
+            question_context, answer_set_context, answer = item
+            question_id, question_name, parent_question_id = question_context
+            entry_ids.append(entry_id)
+            entry_names.append(entry_name)
+            question_set_ids.append(question_set_id)
+            question_set_names.append(question_set_name)
+            question_group_ids.append(question_group_id)
+            question_group_names.append(question_group_name)
+            question_ids.append(question_id)
+            question_names.append(question_name)
+            parent_question_ids.append(parent_question_id)
+            answer_set_ids.append(answer_set_context[0])
+            answer_set_years_from.append(answer_set_context[1])
+            answer_set_years_to.append(answer_set_context[2])
+            answer_set_region_ids.append(answer_set_context[3])
+            answer_set_expert_ids.append(answer_set_context[4])
+            answer_set_status_participants_values.append(answer_set_context[5])
+            answer_set_status_participants_names.append(answer_set_context[6])
+            answer_ids.append(answer["id"])
+            answer_names.append(_intern(answer["name"]))
+            answer_values.append(answer["value"])
+            answer_texts.append(answer["text_input"])
+            notes.append(answer_set_context[7])
+
+            # This fixes a problem with duplication that we should not actually have
+            sub_questions = answer["sub_questions"]
+            if sub_questions:
+                seen_ids = set()
+                unique_sub_questions = []
+                for sub_question in sub_questions:
+                    if sub_question["id"] not in seen_ids:
+                        seen_ids.add(sub_question["id"])
+                        unique_sub_questions.append(sub_question)
+                stack.extend(
+                    (QUESTION, sub_question, question_id)
+                    for sub_question in reversed(unique_sub_questions)
+                )
 
-        return information
+    # local snapshot of the complete dataset
+    SNAPSHOT_TABLES = [
+        ("entries", "list_entries", "entry_id"),
+        ("regions", "list_regions", "region_id"),
+        ("entry_tags", "list_entry_tags", "entry_tag_id"),
+        ("region_tags", "list_region_tags", "region_tag_id"),
+    ]
+
+    def save_snapshot(
+        self,
+        path: str,
+        answers=True,
+        page_size: int = 100,
+        max_workers: int = 8,
+        chunk_size: int = 100,
+    ) -> SnapshotStore:
+        """Materializes entries, regions, tags, related questions and answers into a
+        partitioned Parquet snapshot (see SnapshotStore). Requires pyarrow.
+        Records a watermark, so the snapshot can be kept fresh with .sync_snapshot().
+
+        Args:
+            path (str): directory of the snapshot.
+            answers (bool, optional): Fetch every entry to extract its answers. Defaults to True.
+            page_size (int, optional): Number of results per page of the list endpoints. Defaults to 100.
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            chunk_size (int, optional): Number of entries extracted and written at a time. Defaults to 100.
+
+        Returns:
+            SnapshotStore: the written snapshot.
+        """
+        store = SnapshotStore(path)
+        self.update_snapshot(store, None, answers, page_size, max_workers, chunk_size)
+        return store
+
+    def sync_snapshot(
+        self,
+        path: str,
+        answers=True,
+        page_size: int = 100,
+        max_workers: int = 8,
+        chunk_size: int = 100,
+    ) -> Dict:
+        """Brings a snapshot up to date with the changes since its watermark.
+        Only entries, regions and tags the API returns for start_date=<watermark> are fetched
+        and upserted, and only the changed entries are re-fetched for their answers.
+        Without a watermark (e.g. a new path), a complete snapshot is written instead.
+        The watermark only advances when every changed entry was fetched.
+
+        Args:
+            path (str): directory of the snapshot.
+            answers (bool, optional): Re-fetch changed entries to update their answers. Defaults to True.
+            page_size (int, optional): Number of results per page of the list endpoints. Defaults to 100.
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            chunk_size (int, optional): Number of entries extracted at a time. Defaults to 100.
+
+        Returns:
+            Dict: dictionary mapping entry IDs that failed to fetch to the raised exception.
+        """
+        store = SnapshotStore(path)
+        return self.update_snapshot(
+            store, store.watermark(), answers, page_size, max_workers, chunk_size
+        )
+
+    def update_snapshot(
+        self,
+        store: SnapshotStore,
+        since: Union[datetime, str, None],
+        answers=True,
+        page_size: int = 100,
+        max_workers: int = 8,
+        chunk_size: int = 100,
+    ) -> Dict:
+        """Writes (since=None) or upserts (changes since a date) all tables of a snapshot.
+        See .save_snapshot() and .sync_snapshot().
+
+        Args:
+            store (SnapshotStore): snapshot to update.
+            since (Union[datetime, str, None]): only fetch changes since this date, or everything if None.
+            answers (bool, optional): Fetch entries to extract their answers. Defaults to True.
+            page_size (int, optional): Number of results per page of the list endpoints. Defaults to 100.
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            chunk_size (int, optional): Number of entries extracted at a time. Defaults to 100.
+
+        Returns:
+            Dict: dictionary mapping entry IDs that failed to fetch to the raised exception.
+        """
+        started = datetime.now(timezone.utc)
+        # everything is fetched from the API, as cached responses may predate the watermark
+        list_kwargs = dict(
+            all_pages=True,
+            max_workers=max_workers,
+            limit=page_size,
+            start_date=since,
+            refresh=True,
+        )
+        for table, list_method, key in self.SNAPSHOT_TABLES:
+            df = getattr(self, list_method)(**list_kwargs)
+            if since is None:
+                store.write(table, df)
+            else:
+                store.upsert(table, df, key)
+            if table == "entries":
+                entry_ids = df["entry_id"].tolist() if len(df) else []
+        # related questions are a single request, so always replaced
+        store.write("question_relations", self.get_related_questions())
+
+        failures = {}
+        if answers and since is None:
+            failures = self.save_answers(
+                store, entry_ids, max_workers, chunk_size, refresh=True
+            )
+        elif answers:
+            answer_chunks = list(
+                self.iter_answer_information(
+                    self.iter_find_entries(
+                        entry_ids, max_workers, failures, refresh=True
+                    ),
+                    chunk_size=chunk_size,
+                )
+            )
+            answers_df = (
+                pd.concat(answer_chunks, ignore_index=True)
+                if answer_chunks
+                else self.answer_columns_to_dataframe(
+                    {column: [] for column in ANSWER_COLUMNS}
+                )
+            )
+            # answers of entries that failed to fetch are kept as they are
+            store.upsert(
+                "answers",
+                answers_df,
+                "entry_id",
+                keys=[entry_id for entry_id in entry_ids if entry_id not in failures],
+            )
+            if failures:
+                print(f"Failed to fetch {len(failures)} entries: {list(failures)}")
+
+        if not failures:
+            store.set_watermark(started)
+        return failures
+
+    def save_answers(
+        self,
+        store: SnapshotStore,
+        entry_id_list: list,
+        max_workers: int = 8,
+        chunk_size: int = 100,
+        append=False,
+        refresh=False,
+    ) -> Dict:
+        """Fetches entries and writes their answers to the `answers` table of a snapshot,
+        chunk_size entries at a time.
+
+        Args:
+            store (SnapshotStore): snapshot to write to.
+            entry_id_list (list): list of integer (entry IDs)
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            chunk_size (int, optional): Number of entries extracted and written at a time. Defaults to 100.
+            append (bool, optional): Add to the existing answers instead of replacing them. Defaults to False.
+            refresh (bool, optional): Bypass the caches (see .find_information()). Defaults to False.
+
+        Returns:
+            Dict: dictionary mapping failed entry IDs to the raised exception.
+        """
+        failures = {}
+        answer_chunks = self.iter_answer_information(
+            self.iter_find_entries(entry_id_list, max_workers, failures, refresh),
+            chunk_size=chunk_size,
+        )
+        written = False
+        for answers_df in answer_chunks:
+            store.write("answers", answers_df, append=append or written)
+            written = True
+        if not written and not append:
+            # no entry had answers
+            store.write(
+                "answers",
+                self.answer_columns_to_dataframe(
+                    {column: [] for column in ANSWER_COLUMNS}
+                ),
+            )
+        if failures:
+            print(f"Failed to fetch {len(failures)} entries: {list(failures)}")
+        return failures
@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import time
+from typing import Callable, Dict, List, Tuple, Union
+
+from .api import DRHWrapper
+from ._lazy import lazy_import
+from .metrics import Metrics
+from .retry import RetryBudget
+
+asyncio = lazy_import("asyncio")
+pd = lazy_import("pandas")
+# aiohttp is an optional dependency (drhwrapper[async]), None if not installed
+aiohttp = lazy_import("aiohttp", optional=True)
+
+
+def async_retry_api_call(method):
+    """Retries an awaitable API call with exponential backoff (see DRHWrapper.retry_api_call)."""
+
+    @functools.wraps(method)
+    async def wrapper_api_call(self, *args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return await method(self, *args, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                attempt += 1
+                print(f"Attempt {attempt} failed with error: {e}")
+                delay = self._retry_delay(method.__name__, e, attempt)
+                if delay is None:
+                    raise
+                print(f"Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+
+    return wrapper_api_call
+
+
+class AsyncDRHWrapper:
+    """
+    Asyncio API access to the Database of Religious History (DRH) data.
+
+    Mirrors the public methods of DRHWrapper as awaitables. Parsing is shared with
+    DRHWrapper, so DataFrames are identical to the ones returned by the sync class.
+    Requires aiohttp (pip install drhwrapper[async]).
+    """
+
+    def __init__(
+        self,
+        hostname: str = "religiondatabase.org/public-api",
+        api_key: str = "",
+        ver: str = "v1",
+        max_retries=10,
+        base_delay=1,
+        max_delay=120,
+        pool_size=10,
+        compression=True,
+        retry_budget: float = None,
+        timeout: Union[float, Tuple[float, float]] = (10, 60),
+        endpoint_timeouts: dict = None,
+        hook: Callable[[dict], None] = None,
+    ):
+        """
+        Initializes the API wrapper
+        :param hostname: The hostname of the API (https is assumed unless a scheme is given)
+        :param api_key: The API key
+        :param ver: The version of the API
+        :param pool_size: Number of keep-alive connections kept open to the API
+        :param compression: Accept compressed (gzip, deflate) responses
+        :param retry_budget: Maximum ratio of retries to requests within a minute (see RetryBudget, unlimited if None)
+        :param timeout: Connect and read timeout in seconds, as a number or a (connect, read) tuple
+        :param endpoint_timeouts: Timeouts per endpoint, merged with DRHWrapper.ENDPOINT_TIMEOUTS
+        :param hook: Called with every request, retry and parse event (see Metrics)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncDRHWrapper requires aiohttp: pip install drhwrapper[async]"
+            )
+        self.base_url = DRHWrapper.build_base_url(hostname, ver)
+        self._api_key = api_key
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.pool_size = pool_size
+        self.compression = compression
+        self._session = None
+        self.metrics = Metrics(hook)
+        self.retry_budget = None
+        if retry_budget is not None:
+            self.retry_budget = RetryBudget(retry_budget)
+        self.timeout = timeout
+        self.endpoint_timeouts = {
+            **DRHWrapper.ENDPOINT_TIMEOUTS,
+            **(endpoint_timeouts or {}),
+        }
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Pooled session, created on first use inside the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                auto_decompress=self.compression,
+                headers=None if self.compression else {"Accept-Encoding": "identity"},
+            )
+        return self._session
+
+    async def close(self):
+        """Closes the pooled HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+
+    def stats(self) -> dict:
+        """Summary of the requests, retries and parsing stages so far (see Metrics.stats())."""
+        return self.metrics.stats()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _client_timeout(self, endpoint: str) -> "aiohttp.ClientTimeout":
+        """Timeout of endpoint with the semantics of requests (a number bounds both phases)."""
+        timeout = self.endpoint_timeouts.get(endpoint, self.timeout)
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    async def _get_json(self, *path: str, params: dict = None):
+        """Sends a GET request through the pooled session and decodes the JSON body."""
+        if params is not None:
+            # aiohttp only accepts str/int/float query values
+            params = {key: str(value) for key, value in params.items()}
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        start = time.perf_counter()
+        try:
+            async with self.session.get(
+                os.path.join(self.base_url, *path),
+                params=params,
+                timeout=self._client_timeout(path[0]),
+            ) as response:
+                body = await response.read()
+        except Exception as e:
+            self.metrics.request(path[0], start, error=repr(e))
+            raise
+        self.metrics.request(path[0], start, status=response.status, bytes=len(body))
+        # error responses are retried or not by their status (see is_retryable())
+        response.raise_for_status()
+        return json.loads(body)
+
+    # retry policy shared with DRHWrapper
+    _retry_delay = DRHWrapper._retry_delay
+
+    # parsing shared with DRHWrapper
+    to_comma_separated_string = staticmethod(DRHWrapper.to_comma_separated_string)
+    format_date = staticmethod(DRHWrapper.format_date)
+    list_entries_to_dataframe = staticmethod(DRHWrapper.list_entries_to_dataframe)
+    list_entry_tags_to_dataframe = staticmethod(DRHWrapper.list_entry_tags_to_dataframe)
+    list_regions_to_dataframe = staticmethod(DRHWrapper.list_regions_to_dataframe)
+    list_region_tags_to_dataframe = staticmethod(
+        DRHWrapper.list_region_tags_to_dataframe
+    )
+    compact_dataframe = staticmethod(DRHWrapper.compact_dataframe)
+    simplify_question_relations = staticmethod(DRHWrapper.simplify_question_relations)
+    extract_answerset = staticmethod(DRHWrapper.extract_answerset)
+    answersets_to_dataframe = staticmethod(DRHWrapper.answersets_to_dataframe)
+    entry_list_to_dataframe = staticmethod(DRHWrapper.entry_list_to_dataframe)
+    extract_entry_information = staticmethod(DRHWrapper.extract_entry_information)
+    extract_region_information = staticmethod(DRHWrapper.extract_region_information)
+    extract_entry_tags = staticmethod(DRHWrapper.extract_entry_tags)
+    extract_answers = staticmethod(DRHWrapper.extract_answers)
+    extract_answer_columns = staticmethod(DRHWrapper.extract_answer_columns)
+    extract_entry_answer_columns = staticmethod(DRHWrapper.extract_entry_answer_columns)
+    answer_columns_to_dataframe = staticmethod(DRHWrapper.answer_columns_to_dataframe)
+    extract_answer_information = DRHWrapper.extract_answer_information
+
+    # list endpoints
+    @async_retry_api_call
+    async def list_information(
+        self, endpoint: str, available_params: list, **kwargs
+    ) -> dict:
+        """General method to fetch information. See DRHWrapper.list_information.
+
+        Args:
+            endpoint (str): API endpoint to fetch information from.
+            available_params (list): Specific parameters available for the endpoint.
+            **kwargs: Additional parameters to filter the information.
+
+        Returns:
+            dict: Dictionary containing the API response.
+        """
+        params = DRHWrapper.build_list_params(available_params, **kwargs)
+        return await self._get_json(endpoint, params=params)
+
+    async def list_entries(self, to_dataframe=True, **kwargs):
+        """Fetches entries. See DRHWrapper.list_entries.
+
+        Args:
+            to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Dataframe with entries.
+        """
+        entry_information = await self.list_information(
+            "entries", DRHWrapper.ENTRY_PARAMS, **kwargs
+        )
+        if to_dataframe:
+            entry_information = self.list_entries_to_dataframe(entry_information)
+        return entry_information
+
+    async def list_entry_tags(self, to_dataframe=True, **kwargs):
+        """Fetches entry tags. See DRHWrapper.list_entry_tags.
+
+        Args:
+            to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Dataframe with entry tags.
+        """
+        entry_tags = await self.list_information(
+            "entry_tags", DRHWrapper.ENTRY_TAG_PARAMS, **kwargs
+        )
+        if to_dataframe:
+            entry_tags = self.list_entry_tags_to_dataframe(entry_tags)
+        return entry_tags
+
+    async def list_regions(self, to_dataframe=True, **kwargs):
+        """Fetches regions. See DRHWrapper.list_regions.
+
+        Args:
+            to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Dataframe with regions.
+        """
+        region_information = await self.list_information(
+            "regions", DRHWrapper.REGION_PARAMS, **kwargs
+        )
+        if to_dataframe:
+            region_information = self.list_regions_to_dataframe(region_information)
+        return region_information
+
+    async def list_region_tags(self, to_dataframe=True, **kwargs):
+        """Fetches region tags. See DRHWrapper.list_region_tags.
+
+        Args:
+            to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Dataframe with region tags.
+        """
+        region_tags = await self.list_information(
+            "region_tags", DRHWrapper.REGION_TAG_PARAMS, **kwargs
+        )
+        if to_dataframe:
+            region_tags = self.list_region_tags_to_dataframe(region_tags)
+        return region_tags
+
+    # questionrelation endpoint
+    async def get_related_questions(self, to_dataframe=True, simplify=True):
+        """Get related questions. See DRHWrapper.get_related_questions.
+
+        Args:
+            to_dataframe (bool, optional): Return as pandas dataframe. Defaults to True.
+            simplify (bool, optional): Map each group to its lowest question ID. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Dataframe with question ID (primary key) and related question ID.
+        """
+        questionrelation_json = await self._get_json("questionrelation")
+
+        if not to_dataframe:
+            return questionrelation_json
+
+        questionrelation_df = pd.DataFrame(questionrelation_json)
+
+        if not simplify:
+            return questionrelation_df
+        return self.simplify_question_relations(questionrelation_df)
+
+    # find endpoints
+    @async_retry_api_call
+    async def find_information(self, endpoint: str, id: Union[int, str]) -> Dict:
+        """Fetches a single piece of information. See DRHWrapper.find_information.
+
+        Args:
+            endpoint (str): Specific API endpoint to fetch information from.
+            id (Union[int, str]): ID of the information to fetch
+
+        Returns:
+            Dict: Dictionary containing the API response.
+        """
+        return await self._get_json(endpoint, str(id))
+
+    async def find_entry(self, entry_id: Union[int, str]) -> Dict:
+        """Fetches a single entry from the API."""
+        return await self.find_information("entries", entry_id)
+
+    async def find_entry_tag(self, entry_tag_id: Union[int, str]) -> Dict:
+        """Fetches a single entry tag from the API."""
+        return await self.find_information("entry_tags", entry_tag_id)
+
+    async def find_region(self, region_id: Union[int, str]) -> Dict:
+        """Fetches a single region from the API."""
+        return await self.find_information("regions", region_id)
+
+    async def find_region_tag(self, region_tag_id: Union[int, str]) -> Dict:
+        """Fetches a single region tag from the API."""
+        return await self.find_information("region_tags", region_tag_id)
+
+    @async_retry_api_call
+    async def get_answerset(
+        self, question_name: str, to_dataframe=True
+    ) -> Union[pd.DataFrame, List[Dict]]:
+        """Extract answerset for a specific question. See DRHWrapper.get_answerset.
+
+        Args:
+            question_name (str): name of the question to fetch answerset for.
+            to_dataframe (bool, optional): Return as dataframe, else the raw entries of the
+                API response. Defaults to True.
+
+        Returns:
+            Union[pd.DataFrame, List[Dict]]: Return as dataframe (if to_dataframe=True) or list
+                of entries.
+        """
+        answerset_json = await self._get_json(
+            "entries-by-question", params={"question_name": question_name}
+        )
+        if to_dataframe:
+            return self.extract_answerset(answerset_json)
+        return answerset_json
+
+    async def get_answersets(
+        self,
+        question_names: List[str],
+        max_workers: int = 8,
+        return_failures=False,
+        to_dataframe=True,
+    ) -> Union[pd.DataFrame, Dict[str, List[Dict]], Tuple]:
+        """Fetches the answersets of many questions concurrently. See DRHWrapper.get_answersets.
+
+        Args:
+            question_names (List[str]): names of the questions (duplicates are fetched once).
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            return_failures (bool, optional): Also return a dictionary mapping failed question
+                names to the raised exception. Defaults to False.
+            to_dataframe (bool, optional): Return one dataframe, else a dictionary mapping each
+                question name to the raw entries of its answerset. Defaults to True.
+
+        Returns:
+            Union[pd.DataFrame, Dict[str, List[Dict]]]: Dataframe with the requested
+                question_name and answerset information, or the raw answersets by question name.
+        """
+        question_names = list(dict.fromkeys(question_names))
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def bounded_get_answerset(question_name):
+            async with semaphore:
+                return await self.get_answerset(
+                    question_name, to_dataframe=to_dataframe
+                )
+
+        results = await asyncio.gather(
+            *[bounded_get_answerset(name) for name in question_names],
+            return_exceptions=True,
+        )
+        names = []
+        answersets = []
+        failures = {}
+        for question_name, result in zip(question_names, results):
+            if isinstance(result, Exception):
+                failures[question_name] = result
+            else:
+                names.append(question_name)
+                answersets.append(result)
+        if failures and not return_failures:
+            print(f"Failed to fetch {len(failures)} answersets: {list(failures)}")
+        if to_dataframe:
+            df = self.answersets_to_dataframe(names, answersets)
+        else:
+            df = dict(zip(names, answersets))
+        if return_failures:
+            return df, failures
+        return df
+
+    async def find_entries(
+        self, entry_id_list: list, max_workers: int = 8
+    ) -> Tuple[List[Dict], Dict]:
+        """Fetches many entries concurrently. See DRHWrapper.find_entries.
+
+        Args:
+            entry_id_list (list): list of integer (entry IDs)
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+
+        Returns:
+            Tuple[List[Dict], Dict]: Entries in the order of entry_id_list (failed entries omitted)
+                and a dictionary mapping failed entry IDs to the raised exception.
+        """
+        entry_id_list = list(entry_id_list)
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def bounded_find_entry(entry_id):
+            async with semaphore:
+                return await self.find_entry(entry_id)
+
+        results = await asyncio.gather(
+            *[bounded_find_entry(entry_id) for entry_id in entry_id_list],
+            return_exceptions=True,
+        )
+        entries = []
+        failures = {}
+        for entry_id, result in zip(entry_id_list, results):
+            if isinstance(result, Exception):
+                failures[entry_id] = result
+            else:
+                entries.append(result)
+        return entries, failures
+
+    async def dataframe_from_entry_id_list(
+        self,
+        entry_id_list: list,
+        max_workers: int = 8,
+        return_failures=False,
+        to_dataframe=True,
+    ) -> Union[pd.DataFrame, List[Dict], Tuple]:
+        """Fetches entries from a list of entry IDs. See DRHWrapper.dataframe_from_entry_id_list.
+
+        Args:
+            entry_id_list (list): list of integer (entry IDs)
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            return_failures (bool, optional): Also return a dictionary mapping failed entry IDs
+                to the raised exception. Defaults to False.
+            to_dataframe (bool, optional): Return as dataframe, else the raw entries. Defaults
+                to True.
+
+        Returns:
+            Union[pd.DataFrame, List[Dict]]: Dataframe with entries from search (in the order of
+                entry_id_list) or list of entries.
+        """
+        entry_list, failures = await self.find_entries(entry_id_list, max_workers)
+        if failures and not return_failures:
+            print(f"Failed to fetch {len(failures)} entries: {list(failures)}")
+        df = entry_list
+        if to_dataframe:
+            df = self.entry_list_to_dataframe(entry_list)
+        if return_failures:
+            return df, failures
+        return df
@@ -0,0 +1,187 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Union
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache for API responses.
+
+    Responses are stored as compressed JSON in a SQLite database, keyed by
+    (endpoint, id, normalized params). Entries expire after a per-endpoint TTL and
+    are then revalidated with ETag/Last-Modified when the server provided them.
+    The least recently used entries are evicted once the cache exceeds max_size.
+    """
+
+    # seconds before a cached response has to be revalidated
+    DEFAULT_TTL = {
+        "entries": 7 * 24 * 3600,
+        "regions": 7 * 24 * 3600,
+        "entry_tags": 7 * 24 * 3600,
+        "region_tags": 7 * 24 * 3600,
+        "entries-by-question": 24 * 3600,
+        "questionrelation": 24 * 3600,
+    }
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Dict[str, float] = None,
+        default_ttl: float = 24 * 3600,
+        max_size: int = 512 * 1024**2,
+    ):
+        """
+        Opens (or creates) the cache
+        :param path: Path of the SQLite database file
+        :param ttl: Time to live in seconds per endpoint, merged with DEFAULT_TTL
+        :param default_ttl: Time to live in seconds for endpoints not in ttl
+        :param max_size: Maximum size of the stored (compressed) responses in bytes
+        """
+        self.path = path
+        self.ttl = {**self.DEFAULT_TTL, **(ttl or {})}
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """)
+
+    @staticmethod
+    def make_key(endpoint: str, id: Union[int, str] = None, params: dict = None) -> str:
+        """Builds the cache key of a request from its endpoint, id and parameters."""
+        params = sorted((str(key), str(value)) for key, value in (params or {}).items())
+        return json.dumps([endpoint, None if id is None else str(id), params])
+
+    def get(self, key: str) -> Union[dict, None]:
+        """Looks up a cached response.
+
+        Args:
+            key (str): cache key from .make_key().
+
+        Returns:
+            Union[dict, None]: None if not cached, else a dictionary with the decoded `payload`,
+                whether it is still `fresh` and the `headers` needed to revalidate it.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT endpoint, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            endpoint, body, etag, last_modified, stored_at = row
+            now = time.time()
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return {
+            "payload": json.loads(zlib.decompress(body)),
+            "fresh": now - stored_at < self.ttl.get(endpoint, self.default_ttl),
+            "headers": headers,
+        }
+
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        payload,
+        etag: str = None,
+        last_modified: str = None,
+    ):
+        """Stores a response and evicts the least recently used ones beyond max_size.
+
+        Args:
+            key (str): cache key from .make_key().
+            endpoint (str): endpoint of the request (selects the TTL).
+            payload: decoded JSON response.
+            etag (str, optional): ETag header of the response.
+            last_modified (str, optional): Last-Modified header of the response.
+        """
+        body = zlib.compress(json.dumps(payload).encode("utf-8"))
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), etag, last_modified, now, now),
+            )
+            self._evict()
+
+    def count(self, outcome: str):
+        """Increments the `hits`, `misses` or `revalidations` counter."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def refresh(self, key: str):
+        """Marks a revalidated (304 Not Modified) response as fresh again."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def _evict(self):
+        """Deletes least recently used responses until the cache fits max_size."""
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total_size <= self.max_size:
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total_size <= self.max_size:
+                break
+            evicted.append((key,))
+            total_size -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self):
+        """Deletes all cached responses and resets the counters."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+        self.hits = self.misses = self.revalidations = 0
+
+    def info(self) -> dict:
+        """Hit/miss counters, number of cached responses and their size in bytes."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "entries": entries,
+            "size": size,
+        }
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
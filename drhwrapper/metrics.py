@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+from ._lazy import lazy_import
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger("drhwrapper")
+
+# latencies kept per endpoint for percentiles
+LATENCY_WINDOW = 10_000
+
+
+def logging_hook(log: logging.Logger = logger, level: int = logging.DEBUG) -> Callable:
+    """Builds a hook that logs every event (see Metrics) as a structured log record.
+
+    Args:
+        log (logging.Logger, optional): logger to write to. Defaults to the "drhwrapper" logger.
+        level (int, optional): log level of the records. Defaults to logging.DEBUG.
+
+    Returns:
+        Callable: hook to pass to DRHWrapper(hook=...).
+    """
+
+    def hook(event: dict):
+        log.log(
+            level,
+            " ".join(f"{key}={value}" for key, value in event.items()),
+            extra={"drh_event": event},
+        )
+
+    return hook
+
+
+class Metrics:
+    """
+    Collects request and parsing metrics of a DRHWrapper instance.
+
+    Every measurement is an event dictionary with a `type`:
+    - request: endpoint, status, latency (s), bytes, error
+    - cache: endpoint, cache ("response" or "find"), outcome (hit, miss, revalidated)
+    - retry: method, attempt, error, delay (s)
+    - parse: stage, duration (s), rows
+    - hedge: endpoint, delay (s), won (whether the duplicate request returned first)
+    Events are aggregated for .stats() and passed to the optional hook as they happen.
+    """
+
+    def __init__(self, hook: Callable[[dict], None] = None):
+        """
+        Creates the collector
+        :param hook: Called with every event, e.g. logging_hook()
+        """
+        self.hook = hook
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clears all aggregated metrics."""
+        with self._lock:
+            self._requests = defaultdict(
+                lambda: {"requests": 0, "errors": 0, "bytes": 0, "latency": 0.0}
+            )
+            self._latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+            self._cache = defaultdict(lambda: defaultdict(int))
+            self._retries = defaultdict(int)
+            self._parse = defaultdict(lambda: {"calls": 0, "duration": 0.0, "rows": 0})
+            self._hedges = defaultdict(lambda: {"sent": 0, "won": 0})
+
+    def record(self, event: dict):
+        """Aggregates an event and passes it to the hook."""
+        with self._lock:
+            kind = event["type"]
+            if kind == "request":
+                requests = self._requests[event["endpoint"]]
+                requests["requests"] += 1
+                requests["bytes"] += event.get("bytes") or 0
+                requests["latency"] += event["latency"]
+                status = event.get("status")
+                if "error" in event or (status is not None and status >= 400):
+                    requests["errors"] += 1
+                self._latencies[event["endpoint"]].append(event["latency"])
+            elif kind == "cache":
+                self._cache[event["endpoint"]][event["outcome"]] += 1
+            elif kind == "retry":
+                self._retries[event["method"]] += 1
+            elif kind == "parse":
+                parse = self._parse[event["stage"]]
+                parse["calls"] += 1
+                parse["duration"] += event["duration"]
+                parse["rows"] += event.get("rows") or 0
+            elif kind == "hedge":
+                hedges = self._hedges[event["endpoint"]]
+                hedges["sent"] += 1
+                hedges["won"] += int(event["won"])
+        if self.hook is not None:
+            self.hook(event)
+
+    def request(self, endpoint: str, start: float, status: int = None, **fields):
+        """Records a request to endpoint that started at start (time.perf_counter())."""
+        self.record(
+            {
+                "type": "request",
+                "endpoint": endpoint,
+                "status": status,
+                "latency": time.perf_counter() - start,
+                **fields,
+            }
+        )
+
+    @contextmanager
+    def parse(self, stage: str):
+        """Times a parsing stage. Set `rows` on the yielded dictionary to record the output size."""
+        event = {"type": "parse", "stage": stage, "rows": None}
+        start = time.perf_counter()
+        yield event
+        event["duration"] = time.perf_counter() - start
+        self.record(event)
+
+    def latency_quantile(
+        self, endpoint: str, quantile: float, min_samples: int = 1
+    ) -> float:
+        """Quantile of the latency of the recent requests to endpoint
+        (None with fewer than min_samples requests)."""
+        with self._lock:
+            latencies = list(self._latencies.get(endpoint, ()))
+        if not latencies or len(latencies) < min_samples:
+            return None
+        return float(np.quantile(latencies, quantile))
+
+    def stats(self) -> Dict[str, dict]:
+        """Summary of the recorded events.
+
+        Returns:
+            Dict[str, dict]: `requests` per endpoint (count, errors, bytes, total and mean latency,
+                p50/p95/max latency), `cache` outcomes per endpoint, `retries` per method,
+                `parse` calls, total duration and rows per stage and `hedges` sent and won
+                per endpoint.
+        """
+        with self._lock:
+            requests = {}
+            for endpoint, totals in self._requests.items():
+                latencies = np.fromiter(self._latencies[endpoint], dtype=float)
+                requests[endpoint] = {
+                    **totals,
+                    "mean_latency": totals["latency"] / totals["requests"],
+                    "p50_latency": float(np.quantile(latencies, 0.5)),
+                    "p95_latency": float(np.quantile(latencies, 0.95)),
+                    "max_latency": float(latencies.max()),
+                }
+            return {
+                "requests": requests,
+                "cache": {
+                    endpoint: dict(outcomes)
+                    for endpoint, outcomes in self._cache.items()
+                },
+                "retries": dict(self._retries),
+                "parse": {stage: dict(totals) for stage, totals in self._parse.items()},
+                "hedges": {
+                    endpoint: dict(totals) for endpoint, totals in self._hedges.items()
+                },
+            }
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from ._lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+class QuestionIndex:
+    """
+    Index of related questions.
+
+    Maps every question ID to the canonical ID of its group of related questions
+    (the lowest question ID within the group, see DRHWrapper.simplify_question_relations)
+    through a dense lookup array, and every canonical ID to the members of its group.
+    Question IDs without related questions map to themselves.
+    """
+
+    def __init__(self, question_ids, canonical_ids):
+        """
+        Builds the index
+        :param question_ids: Question IDs (non-negative integers)
+        :param canonical_ids: Canonical question ID of each question
+        """
+        question_ids = np.asarray(question_ids, dtype=np.int64)
+        canonical_ids = np.asarray(canonical_ids, dtype=np.int64)
+        if len(question_ids) and question_ids.min() < 0:
+            raise ValueError("Question IDs must be non-negative integers")
+
+        # dense array: position = question ID, value = canonical ID
+        size = int(question_ids.max()) + 1 if len(question_ids) else 0
+        self._lookup = np.arange(size, dtype=np.int64)
+        self._lookup[question_ids] = canonical_ids
+
+        # members sorted by (canonical ID, question ID) for contiguous groups
+        order = np.lexsort((question_ids, canonical_ids))
+        self._members = question_ids[order]
+        self._member_groups = canonical_ids[order]
+        self._question_ids = np.sort(question_ids)
+
+    @classmethod
+    def from_relations(cls, questionrelation_df: pd.DataFrame) -> "QuestionIndex":
+        """Builds the index from simplified related questions.
+
+        Args:
+            questionrelation_df (pd.DataFrame): output of the .get_related_questions() or
+                .simplify_question_relations() method.
+
+        Returns:
+            QuestionIndex: index of related questions.
+        """
+        return cls(
+            questionrelation_df["question_id"].to_numpy(),
+            questionrelation_df["related_question_id"].to_numpy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, question_id) -> bool:
+        position = np.searchsorted(self._question_ids, question_id)
+        return bool(
+            position < len(self._question_ids)
+            and self._question_ids[position] == question_id
+        )
+
+    def canonical(self, question_ids) -> np.ndarray:
+        """Looks up the canonical question ID of many question IDs at once.
+
+        Args:
+            question_ids (array-like): question IDs.
+
+        Returns:
+            np.ndarray: canonical question IDs (question IDs not in the index map to themselves).
+        """
+        question_ids = np.asarray(question_ids, dtype=np.int64)
+        in_range = (question_ids >= 0) & (question_ids < len(self._lookup))
+        return np.where(
+            in_range,
+            self._lookup[np.where(in_range, question_ids, 0)],
+            question_ids,
+        )
+
+    def members(self, canonical_id: int) -> np.ndarray:
+        """Question IDs in the group of related questions of canonical_id.
+
+        Args:
+            canonical_id (int): canonical question ID.
+
+        Returns:
+            np.ndarray: sorted question IDs of the group (empty if unknown).
+        """
+        start = np.searchsorted(self._member_groups, canonical_id, side="left")
+        stop = np.searchsorted(self._member_groups, canonical_id, side="right")
+        return self._members[start:stop]
+
+    def apply(
+        self,
+        df: pd.DataFrame,
+        column: str = "question_id",
+        target: str = "related_question_id",
+    ) -> pd.DataFrame:
+        """Adds the canonical question ID of every row in one vectorized lookup.
+
+        Args:
+            df (pd.DataFrame): dataframe with question IDs, e.g. from the .get_answerset() method.
+            column (str, optional): column with question IDs. Defaults to "question_id".
+            target (str, optional): column to store canonical IDs in. Defaults to "related_question_id".
+
+        Returns:
+            pd.DataFrame: copy of df with the target column.
+        """
+        return df.assign(**{target: self.canonical(df[column].to_numpy())})
+
+    def save(self, path: str):
+        """Saves the index to a compressed .npz file.
+
+        Args:
+            path (str): file path (used as given).
+        """
+        # numpy only appends .npz to file names, not to open files
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f, question_ids=self._members, canonical_ids=self._member_groups
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "QuestionIndex":
+        """Loads an index saved with .save().
+
+        Args:
+            path (str): file path.
+
+        Returns:
+            QuestionIndex: index of related questions.
+        """
+        with np.load(path) as data:
+            return cls(data["question_ids"], data["canonical_ids"])
@@ -0,0 +1,127 @@
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Union
+
+# status codes signalling that the server is overloaded or throttling
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter shared by all requests of a DRHWrapper instance.
+
+    Requests take a token from a token bucket (refilled at `rate` per second) and a slot
+    out of the allowed number of concurrent requests. The concurrency limit adapts like
+    TCP congestion control: halved whenever the server throttles (429) or fails (5xx),
+    and raised by one after a full window of successful requests, up to max_concurrent.
+    A Retry-After header pauses all requests until the given time.
+    """
+
+    def __init__(self, rate: float = None, burst: int = 1, max_concurrent: int = None):
+        """
+        Creates the limiter
+        :param rate: Maximum number of requests per second (unlimited if None)
+        :param burst: Number of requests that may be sent at once after an idle period
+        :param max_concurrent: Maximum number of requests in flight (unlimited if None)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrent = max_concurrent
+        self.concurrency = max_concurrent or math.inf
+        self.in_flight = 0
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float):
+        if self.rate is None:
+            self._tokens = float(self.burst)
+        else:
+            elapsed = now - self._refilled_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._refilled_at = now
+
+    def acquire(self):
+        """Blocks until a request may be sent (token available, slot free, not paused)."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._blocked_until > now:
+                    timeout = self._blocked_until - now
+                elif self.in_flight >= self.concurrency:
+                    timeout = None  # woken up by release()
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.in_flight += 1
+                        return
+                    timeout = (1 - self._tokens) / self.rate
+                self._condition.wait(timeout)
+
+    def release(self, status_code: int = None, retry_after: str = None):
+        """Frees the slot of a finished request and adapts to the server's response.
+
+        Args:
+            status_code (int, optional): status code of the response (None if the request
+                failed without a response).
+            retry_after (str, optional): Retry-After header of the response.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if status_code in THROTTLE_STATUS_CODES:
+                self.throttled += 1
+                self._successes = 0
+                # multiplicative decrease, counting the request that just finished
+                current = min(self.concurrency, self.in_flight + 1)
+                self.concurrency = max(1, current // 2)
+                self._tokens = 0.0
+                delay = self.parse_retry_after(retry_after)
+                if delay:
+                    self._blocked_until = max(
+                        self._blocked_until, time.monotonic() + delay
+                    )
+            elif status_code is not None:
+                # additive increase after a window of successful requests
+                self._successes += 1
+                if self._successes >= self.concurrency and (
+                    self.max_concurrent is None
+                    or self.concurrency < self.max_concurrent
+                ):
+                    self.concurrency += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+    @staticmethod
+    def parse_retry_after(retry_after: Union[str, None]) -> float:
+        """Seconds to wait according to a Retry-After header (in seconds or an HTTP date)."""
+        if not retry_after:
+            return 0.0
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 0.0
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def info(self) -> dict:
+        """Current concurrency limit, requests in flight and number of throttled responses."""
+        with self._condition:
+            return {
+                "rate": self.rate,
+                "concurrency": self.concurrency,
+                "max_concurrent": self.max_concurrent,
+                "in_flight": self.in_flight,
+                "throttled": self.throttled,
+            }
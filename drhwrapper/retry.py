@@ -0,0 +1,114 @@
+import json
+import sys
+import threading
+import time
+from collections import deque
+
+import requests
+
+# status codes of responses that may succeed when the request is sent again
+RETRYABLE_STATUS_CODES = {408, 429}
+
+# errors raised before a complete response was received
+RETRYABLE_ERRORS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ContentDecodingError,
+    # a truncated or garbled body (a valid body of the wrong shape is a plain ValueError)
+    json.JSONDecodeError,
+    requests.exceptions.JSONDecodeError,
+)
+
+
+def _status_code(error: Exception):
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None)
+    if status_code is None:
+        # aiohttp.ClientResponseError
+        status_code = getattr(error, "status", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed request may succeed when it is sent again.
+
+    Timeouts, connection errors, truncated bodies, throttling (429) and server errors (5xx)
+    are retryable. Client errors (4xx) and valid responses that are not what was expected
+    (e.g. a JSON error object instead of an array) are not.
+    """
+    status_code = _status_code(error)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+    # only check asyncio and aiohttp errors if they are in use (they are imported lazily)
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None and isinstance(error, asyncio.TimeoutError):
+        return True
+    aiohttp = sys.modules.get("aiohttp")
+    return aiohttp is not None and isinstance(
+        error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+    )
+
+
+class RetryBudget:
+    """
+    Retry budget shared by all requests of a DRHWrapper instance.
+
+    Retries are allowed up to a ratio of the requests sent within a sliding window, plus a
+    minimum number of retries so that rarely used clients can still retry. While a degraded
+    server fails every request, it sees at most (1 + ratio) times the regular load instead
+    of max_retries times.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 60.0):
+        """
+        Creates the budget
+        :param ratio: Maximum number of retries per request sent
+        :param min_retries: Number of retries allowed within the window regardless of the ratio
+        :param window: Length of the sliding window in seconds
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.exhausted = 0
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float):
+        for times in (self._requests, self._retries):
+            while times and times[0] <= now - self.window:
+                times.popleft()
+
+    def deposit(self):
+        """Records a request sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Takes a retry from the budget, returns False (and counts it) if it is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(
+                self._requests
+            ):
+                self.exhausted += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def info(self) -> dict:
+        """Requests and retries within the window and number of retries refused."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return {
+                "ratio": self.ratio,
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "exhausted": self.exhausted,
+            }
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Union
+
+from ._lazy import lazy_import
+
+pd = lazy_import("pandas")
+# pyarrow is an optional dependency (drhwrapper[parquet]), None if not installed
+pa = lazy_import("pyarrow", optional=True)
+pc = lazy_import("pyarrow.compute", optional=True)
+ds = lazy_import("pyarrow.dataset", optional=True)
+pq = lazy_import("pyarrow.parquet", optional=True)
+
+
+class SnapshotStore:
+    """
+    Local columnar snapshot of the DRH data.
+
+    Every table (entries, regions, tags, related questions, answers) is stored as a
+    hive-partitioned Parquet dataset in its own directory below path, together with its
+    schema, so tables can be scanned lazily with column and predicate pushdown.
+    Requires pyarrow (pip install drhwrapper[parquet]).
+    """
+
+    # columns each table is partitioned by on disk
+    PARTITIONS = {
+        "entries": ["poll_id"],
+        "answers": ["question_set_id"],
+    }
+
+    # Arrow types of columns whose pandas dtype depends on the rows, e.g. string columns
+    # that are all missing (float NaN) in some chunks
+    COLUMN_TYPES = {
+        "answers": {
+            column: "large_string"
+            for column in [
+                "entry_name",
+                "question_set_name",
+                "question_group_name",
+                "question_name",
+                "answer_name",
+                "answer_text",
+                "notes",
+            ]
+        },
+    }
+
+    METADATA_FILE = "snapshot.json"
+    SCHEMA_FILE = "_common_metadata"
+    # directory of the new files below the staging directory of an append or upsert
+    ROWS_DIR = "rows"
+
+    def __init__(self, path: str, partitions: Dict[str, List[str]] = None):
+        """
+        Opens (or creates) the snapshot
+        :param path: Directory of the snapshot
+        :param partitions: Partition columns per table, merged with PARTITIONS
+        """
+        if pa is None:
+            raise ImportError(
+                "SnapshotStore requires pyarrow: pip install drhwrapper[parquet]"
+            )
+        self.path = path
+        self.partitions = {**self.PARTITIONS, **(partitions or {})}
+        os.makedirs(path, exist_ok=True)
+
+    def _table_path(self, table: str) -> str:
+        return os.path.join(self.path, table)
+
+    def tables(self) -> List[str]:
+        """Names of the tables in the snapshot."""
+        return [
+            table
+            for table in sorted(os.listdir(self.path))
+            if os.path.isfile(os.path.join(self._table_path(table), self.SCHEMA_FILE))
+        ]
+
+    def schema(self, table: str) -> "pa.Schema":
+        """Arrow schema of a table (including the partition columns)."""
+        return pq.read_schema(os.path.join(self._table_path(table), self.SCHEMA_FILE))
+
+    def write(self, table: str, df: pd.DataFrame, append=False):
+        """Writes a DataFrame as a table, replacing the table unless append=True.
+        A replaced table is written next to the old one and swapped in once complete.
+
+        Args:
+            table (str): name of the table.
+            df (pd.DataFrame): rows to write.
+            append (bool, optional): Add the rows to the existing table. Defaults to False.
+        """
+        table_path = self._table_path(table)
+        append = append and os.path.isdir(table_path)
+        data = self._to_arrow(table, df, self.schema(table) if append else None)
+        write_path = f"{table_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            if append:
+                self._write_files(table, data, os.path.join(write_path, self.ROWS_DIR))
+                self._swap_in(table, write_path, {}, data.schema)
+            else:
+                self._write_files(table, data, write_path)
+                pq.write_metadata(
+                    data.schema, os.path.join(write_path, self.SCHEMA_FILE)
+                )
+                if os.path.isdir(table_path):
+                    shutil.rmtree(table_path)
+                os.replace(write_path, table_path)
+        finally:
+            shutil.rmtree(write_path, ignore_errors=True)
+        self._update_metadata(table, rows=self.dataset(table).count_rows())
+
+    def _write_files(self, table: str, data: "pa.Table", path: str):
+        """Writes rows as new (partitioned) files below path."""
+        os.makedirs(path, exist_ok=True)
+        pq.write_to_dataset(
+            data,
+            path,
+            partition_cols=self.partitions.get(table),
+            basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+        )
+
+    def _swap_in(
+        self, table: str, staging: str, replaced: Dict[str, str], schema: "pa.Schema"
+    ):
+        """Moves the new files written below staging/ROWS_DIR into the table, then
+        replaces (or removes, if mapped to None) the rewritten files and widens the stored
+        schema. Only renames are left at this point, so a failed write leaves the table
+        untouched."""
+        table_path = self._table_path(table)
+        rows_path = os.path.join(staging, self.ROWS_DIR)
+        for root, _, names in os.walk(rows_path):
+            for name in names:
+                target = os.path.join(
+                    table_path, os.path.relpath(os.path.join(root, name), rows_path)
+                )
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(os.path.join(root, name), target)
+        for path, staged in replaced.items():
+            if staged is None:
+                os.remove(path)
+            else:
+                os.replace(staged, path)
+        # chunks may lack values for a column (null type), so widen to a common schema
+        schema = pa.unify_schemas(
+            [self.schema(table), schema], promote_options="permissive"
+        )
+        pq.write_metadata(schema, os.path.join(table_path, self.SCHEMA_FILE))
+
+    def _to_arrow(
+        self, table: str, df: pd.DataFrame, stored: "pa.Schema" = None
+    ) -> "pa.Table":
+        """Converts rows to Arrow with the types of COLUMN_TYPES and, when appending,
+        of the stored schema, so that chunks of a table always have compatible types."""
+        data = pa.Table.from_pandas(df, preserve_index=False)
+        types = {
+            column: pa.type_for_alias(alias)
+            for column, alias in self.COLUMN_TYPES.get(table, {}).items()
+        }
+        if stored is not None:
+            types.update(
+                {
+                    field.name: field.type
+                    for field in stored
+                    if not pa.types.is_null(field.type)
+                }
+            )
+        fields = [
+            pa.field(field.name, types.get(field.name, field.type))
+            for field in data.schema
+        ]
+        return data.cast(pa.schema(fields, metadata=data.schema.metadata))
+
+    def upsert(self, table: str, df: pd.DataFrame, key: str, keys: list = None):
+        """Replaces the rows of a table whose key is in keys by the rows of df.
+        Only the files holding replaced rows are rewritten and the rows of df are added as
+        new files, so the cost depends on the number of changes, not on the size of the table.
+
+        Args:
+            table (str): name of the table.
+            df (pd.DataFrame): new or changed rows.
+            key (str): column identifying rows, e.g. "entry_id" (not a partition column).
+            keys (list, optional): key values to replace (rows of the table without a
+                counterpart in df are deleted). Defaults to the key values of df.
+        """
+        if table not in self.tables():
+            self.write(table, df)
+            return
+        if key in (self.partitions.get(table) or []):
+            raise ValueError(f"Cannot upsert {table} by its partition column {key}")
+        if keys is None:
+            keys = df[key].unique() if len(df) else []
+        data = self._to_arrow(table, df, self.schema(table))
+        # the rewritten files and the new rows are staged and only swapped in once all
+        # of them have been written
+        staging = f"{self._table_path(table)}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(staging)
+            replaced = (
+                self._stage_deletes(table, key, keys, staging) if len(keys) else {}
+            )
+            if len(df):
+                self._write_files(table, data, os.path.join(staging, self.ROWS_DIR))
+            self._swap_in(table, staging, replaced, data.schema)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self._update_metadata(table, rows=self.dataset(table).count_rows())
+
+    def _stage_deletes(
+        self, table: str, key: str, keys: list, staging: str
+    ) -> Dict[str, Union[str, None]]:
+        """Rewrites the files of a table that hold rows whose key is in keys, without them,
+        into staging. Returns the staged file per rewritten file (None if it becomes empty).
+        """
+        keys = pa.array(keys, type=self.schema(table).field(key).type)
+        expression = ds.field(key).isin(keys)
+        replaced = {}
+        for fragment in self.dataset(table).get_fragments():
+            # row group statistics skip files without any of the keys unread
+            if not fragment.count_rows(filter=expression):
+                continue
+            # the file itself, without the partition columns of its directory
+            data = pq.ParquetFile(fragment.path).read()
+            remaining = data.filter(pc.invert(pc.is_in(data[key], value_set=keys)))
+            if remaining.num_rows:
+                replaced[fragment.path] = os.path.join(
+                    staging, f"{uuid.uuid4().hex}.parquet"
+                )
+                pq.write_table(remaining, replaced[fragment.path])
+            else:
+                replaced[fragment.path] = None
+        return replaced
+
+    def dataset(self, table: str) -> "ds.Dataset":
+        """Lazily opens a table as an Arrow dataset (nothing is read until it is scanned).
+
+        Args:
+            table (str): name of the table.
+
+        Returns:
+            ds.Dataset: dataset with the stored schema.
+        """
+        schema = self.schema(table)
+        partition_cols = self.partitions.get(table) or []
+        return ds.dataset(
+            self._table_path(table),
+            schema=schema,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([schema.field(column) for column in partition_cols]),
+                flavor="hive",
+            ),
+        )
+
+    def load(
+        self,
+        table: str,
+        columns: List[str] = None,
+        filters: Union[list, "ds.Expression"] = None,
+    ) -> pd.DataFrame:
+        """Reads a table, only loading the requested columns and the rows matching filters.
+        Filters on partition columns skip whole directories, other filters use the
+        Parquet row group statistics.
+
+        Args:
+            table (str): name of the table.
+            columns (List[str], optional): columns to read. Defaults to all columns.
+            filters (Union[list, ds.Expression], optional): pyarrow expression or list of
+                (column, op, value) tuples, e.g. [("poll_id", "=", 8)]. Defaults to None.
+
+        Returns:
+            pd.DataFrame: rows of the table.
+        """
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters)
+        return self.dataset(table).to_table(columns=columns, filter=filters).to_pandas()
+
+    def watermark(self) -> Union[str, None]:
+        """Start time ('YYYY-MM-DDTHH:MM:SS', UTC) of the last complete sync, None if never synced."""
+        return self.metadata().get("watermark")
+
+    def set_watermark(self, watermark: datetime):
+        """Records the start time of a complete sync (see DRHWrapper.sync_snapshot)."""
+        metadata = self.metadata()
+        metadata["watermark"] = watermark.strftime("%Y-%m-%dT%H:%M:%S")
+        self._write_metadata(metadata)
+
+    def metadata(self) -> dict:
+        """Contents of the snapshot metadata (number of rows and time written per table)."""
+        metadata_path = os.path.join(self.path, self.METADATA_FILE)
+        if not os.path.isfile(metadata_path):
+            return {"tables": {}}
+        with open(metadata_path) as f:
+            return json.load(f)
+
+    def _update_metadata(self, table: str, **values):
+        metadata = self.metadata()
+        metadata["tables"][table] = {
+            **metadata["tables"].get(table, {}),
+            **values,
+            "written_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._write_metadata(metadata)
+
+    def _write_metadata(self, metadata: dict):
+        metadata_path = os.path.join(self.path, self.METADATA_FILE)
+        with open(f"{metadata_path}.tmp", "w") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(f"{metadata_path}.tmp", metadata_path)
@@ -30,12 +30,15 @@ setuptools.setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "networkx>=3.0",
         "numpy>=1.24.0",
         "pandas>=2.0",
         "requests>=2.27.0",
         "tqdm",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "parquet": ["pyarrow>=14.0"],
+    },
     packages=setuptools.find_packages(),
     include_package_data=True,
     keywords=["religion", "history", "api", "wrapper"],
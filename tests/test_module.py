@@ -1,12 +1,38 @@
+import asyncio
+import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import pandas as pd
 import numpy as np
+import requests
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import AsyncMock
 from drhwrapper import DRHWrapper  # Import your class from your package
+from drhwrapper import AsyncDRHWrapper
+from drhwrapper import QuestionIndex
+from drhwrapper import RateLimiter
+from drhwrapper.retry import is_retryable
+from drhwrapper import SnapshotStore
+from drhwrapper.api import ANSWERSET_COLUMNS
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 
 class TestDRHWrapper(unittest.TestCase):
-    @patch("drhwrapper.api.requests.get")
+    @patch("drhwrapper.api.requests.Session.get")
 
     # test networkx
     def test_get_related_questions(self, mock_get):
@@ -17,6 +43,9 @@ class TestDRHWrapper(unittest.TestCase):
             {"first_question_id": 3, "second_question_id": 1},
             {"first_question_id": 4, "second_question_id": 4},
         ]
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(mock_response_data).encode()
         mock_get.return_value.json.return_value = mock_response_data
 
         # Expected DataFrame setup
@@ -57,6 +86,58 @@ class TestDRHWrapper(unittest.TestCase):
         result_df = instance.simplify_question_relations(input_df)
         pd.testing.assert_frame_equal(result_df, expected_df)
 
+    # test union-find on long chains and separate components
+    def test_simplify_chain(self):
+        first = [50, 40, 30, 20, 7, 9]
+        second = [40, 30, 20, 10, 9, 8]
+        input_df = pd.DataFrame(
+            {"first_question_id": first, "second_question_id": second}
+        )
+        expected_df = pd.DataFrame(
+            {
+                "question_id": [7, 8, 9, 10, 20, 30, 40, 50],
+                "related_question_id": [7, 7, 7, 10, 10, 10, 10, 10],
+            }
+        )
+        result_df = DRHWrapper.simplify_question_relations(input_df)
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_question_index(self):
+        relations = DRHWrapper.simplify_question_relations(
+            pd.DataFrame(
+                {
+                    "first_question_id": [50, 40, 30, 20, 7, 9],
+                    "second_question_id": [40, 30, 20, 10, 9, 8],
+                }
+            )
+        )
+        index = QuestionIndex.from_relations(relations)
+        self.assertEqual(len(index), 8)
+        self.assertIn(30, index)
+        self.assertNotIn(11, index)
+        np.testing.assert_array_equal(
+            index.canonical([50, 8, 11, 1000]), [10, 7, 11, 1000]
+        )
+        np.testing.assert_array_equal(index.members(10), [10, 20, 30, 40, 50])
+
+        answers = pd.DataFrame(
+            {"question_id": [40, 9, 99], "answer": ["Yes", "No", "Yes"]}
+        )
+        result = index.apply(answers)
+        self.assertEqual(result["related_question_id"].tolist(), [10, 7, 99])
+        self.assertNotIn("related_question_id", answers)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "questions.npz")
+            index.save(path)
+            loaded = QuestionIndex.load(path)
+            # paths without the .npz suffix are used as given
+            index.save(os.path.join(tmp, "questions"))
+            self.assertEqual(os.listdir(tmp).count("questions"), 1)
+            self.assertEqual(len(QuestionIndex.load(os.path.join(tmp, "questions"))), 8)
+        np.testing.assert_array_equal(loaded.canonical([50, 8, 11]), [10, 7, 11])
+        np.testing.assert_array_equal(loaded.members(7), [7, 8, 9])
+
     # test numpy
     def test_nan_assignment(self):
         """
@@ -68,6 +149,1009 @@ class TestDRHWrapper(unittest.TestCase):
 
         self.assertTrue(np.isnan(data[2]), "The element should be NaN")
 
+    # test concurrent bulk fetch
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_dataframe_from_entry_id_list_concurrent(self, mock_get):
+        def fake_get(url, **kwargs):
+            entry_id = int(url.rstrip("/").split("/")[-1])
+            if entry_id == 3:
+                raise requests.exceptions.ConnectionError("connection refused")
+            entry = {
+                "id": entry_id,
+                "name": {"id": entry_id * 10, "name": f"entry {entry_id}"},
+            }
+            response = unittest.mock.Mock(
+                status_code=200, headers={}, content=json.dumps(entry).encode()
+            )
+            response.json.return_value = entry
+            return response
+
+        mock_get.side_effect = fake_get
+        instance = DRHWrapper(max_retries=1, base_delay=0)
+        df, failures = instance.dataframe_from_entry_id_list(
+            [5, 1, 3, 4, 2], max_workers=4, return_failures=True
+        )
+
+        self.assertEqual(df["entry_id"].tolist(), [5, 1, 4, 2])
+        self.assertEqual(df["entry_name"].tolist()[0], "entry 5")
+        self.assertEqual(list(failures), [3])
+        self.assertIsInstance(failures[3], requests.exceptions.ConnectionError)
+
+    # test pooled session
+    def test_session_lifecycle(self):
+        with DRHWrapper(pool_size=4, compression=False) as instance:
+            adapter = instance.session.get_adapter(instance.base_url)
+            self.assertEqual(adapter._pool_maxsize, 4)
+            self.assertEqual(instance.session.headers["Accept-Encoding"], "identity")
+        instance = DRHWrapper()
+        with patch.object(instance.session, "close") as mock_close:
+            with instance:
+                pass
+        mock_close.assert_called_once()
+
+    # test lazy imports
+    def test_import_is_lazy(self):
+        heavy = ["pandas", "numpy", "tqdm", "aiohttp", "pyarrow", "networkx", "asyncio"]
+        code = (
+            "import sys, drhwrapper; "
+            f"print(' '.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    @staticmethod
+    def fake_entry_tag_pages(n_tags=5, max_limit=None):
+        """Entry tags served by a fake paginated list endpoint capping limit at max_limit."""
+        tags = [
+            {
+                "id": tag_id,
+                "name": f"tag {tag_id}",
+                "approved": True,
+                "parent_tag_id": None,
+                "created": "2016-05-17T02:39:38.090109Z",
+                "created_by": {
+                    "id": 1,
+                    "username": "root",
+                    "first_name": "",
+                    "last_name": "",
+                },
+            }
+            for tag_id in range(n_tags)
+        ]
+
+        def fake_get_json(endpoint, params=None, refresh=False):
+            limit, offset = params["limit"], params.get("offset", 0)
+            if max_limit is not None:
+                limit = min(limit, max_limit)
+            next_url = None
+            if offset + limit < len(tags):
+                next_url = (
+                    f"https://x/v1/{endpoint}?limit={limit}&offset={offset + limit}"
+                )
+            return {
+                "count": len(tags),
+                "next": next_url,
+                "results": tags[offset : offset + limit],
+            }
+
+        return tags, fake_get_json
+
+    # test pagination
+    def test_iter_entry_tags_follows_next(self):
+        tags, fake_get_json = self.fake_entry_tag_pages()
+        instance = DRHWrapper()
+        with patch.object(instance, "_get_json", side_effect=fake_get_json) as mock:
+            rows = list(instance.iter_entry_tags(rows=True, limit=2, approved=True))
+            self.assertEqual(rows, tags)
+            self.assertEqual(mock.call_args.kwargs["params"]["approved"], True)
+
+            pages = list(instance.iter_entry_tags(prefetch=True, limit=2))
+            self.assertEqual([len(page) for page in pages], [2, 2, 1])
+            self.assertEqual(pd.concat(pages)["entry_tag_id"].tolist(), [0, 1, 2, 3, 4])
+
+    # test concurrent pagination
+    def test_list_entry_tags_all_pages(self):
+        tags, fake_get_json = self.fake_entry_tag_pages()
+        instance = DRHWrapper()
+        with patch.object(instance, "_get_json", side_effect=fake_get_json) as mock:
+            result_df = instance.list_entry_tags(all_pages=True, limit=2, offset=1)
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(result_df["entry_tag_id"].tolist(), [1, 2, 3, 4])
+
+        # the server caps limit, so pages are smaller than requested
+        tags, fake_get_json = self.fake_entry_tag_pages(n_tags=10, max_limit=2)
+        with patch.object(instance, "_get_json", side_effect=fake_get_json):
+            result_df = instance.list_entry_tags(all_pages=True, limit=5)
+            iterated = list(instance.iter_entry_tags(rows=True, limit=5))
+        self.assertEqual(result_df["entry_tag_id"].tolist(), list(range(10)))
+        self.assertEqual([tag["id"] for tag in iterated], list(range(10)))
+
+    # test persistent response cache
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_response_cache_revalidation(self, mock_get):
+        region = {"id": 805, "name": "Mongolia ca. 1920"}
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"ETag": '"v1"'}
+        mock_get.return_value.content = json.dumps(region).encode()
+        mock_get.return_value.json.return_value = region
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "cache.sqlite")
+            with DRHWrapper(cache_path=cache_path) as instance:
+                self.assertEqual(instance.find_region(805), region)
+                self.assertEqual(instance.find_region(805), region)
+                self.assertEqual(mock_get.call_count, 1)
+                self.assertEqual(instance.cache_info()["hits"], 1)
+                self.assertEqual(instance.cache_info()["misses"], 1)
+                # a refresh revalidates the fresh response
+                instance.fetch_information("regions", 805, refresh=True)
+                self.assertEqual(mock_get.call_count, 2)
+                self.assertEqual(
+                    mock_get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+                )
+
+            # expired responses are revalidated with their ETag
+            with DRHWrapper(
+                cache_path=cache_path, cache_ttl={"regions": 0}
+            ) as instance:
+                mock_get.return_value.status_code = 304
+                mock_get.return_value.json.side_effect = ValueError("empty body")
+                self.assertEqual(instance.find_region(805), region)
+                self.assertEqual(
+                    mock_get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+                )
+                self.assertEqual(instance.cache_info()["revalidations"], 1)
+
+    # test in-memory LRU cache for find lookups
+    def test_find_cache_lru(self):
+        instance = DRHWrapper(find_cache_size=2)
+        with patch.object(
+            instance,
+            "_get_json",
+            side_effect=lambda endpoint, id, refresh=False: {"id": int(id)},
+        ) as mock:
+            instance.find_region(1)
+            instance.find_region(2)
+            instance.find_region(1)  # hit, 2 is now least recently used
+            instance.find_region_tag(1)  # evicts region 2
+            instance.find_region(1)
+            self.assertEqual(mock.call_count, 3)
+            instance.find_region(2)
+            self.assertEqual(mock.call_count, 4)
+
+            instance.clear_find_cache("regions")
+            self.assertEqual(instance.find_cache_info()["size"], 0)
+            instance.find_region(1)
+            self.assertEqual(mock.call_count, 5)
+            # a refresh bypasses the cached region 1
+            instance.find_information("regions", 1, refresh=True)
+            self.assertEqual(mock.call_count, 6)
+        self.assertEqual(
+            instance.find_cache_info(),
+            {"hits": 2, "misses": 6, "size": 1, "capacity": 2},
+        )
+
+    # test shared rate limiter
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_rate_limiter_throttling(self, mock_get):
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0, "calls": 0}
+
+        def fake_get(url, **kwargs):
+            with lock:
+                state["calls"] += 1
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                throttle = state["calls"] == 1
+            time.sleep(0.01)
+            with lock:
+                state["in_flight"] -= 1
+            response = MagicMock(status_code=429 if throttle else 200, content=b"{}")
+            response.headers = {"Retry-After": "0.2"} if throttle else {}
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                "429 Too Many Requests"
+            )
+            response.json.return_value = {"id": int(url.rstrip("/").split("/")[-1])}
+            return response
+
+        mock_get.side_effect = fake_get
+        instance = DRHWrapper(base_delay=0, max_concurrent=4)
+        start = time.monotonic()
+        entries, failures = instance.find_entries(range(20), max_workers=8)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual(failures, {})
+        self.assertEqual([entry["id"] for entry in entries], list(range(20)))
+        self.assertLessEqual(state["peak"], 4)
+        info = instance.rate_limiter.info()
+        self.assertEqual(info["throttled"], 1)
+        self.assertLessEqual(info["concurrency"], 4)
+
+    def test_rate_limiter_pacing(self):
+        limiter = RateLimiter(rate=100)
+        start = time.monotonic()
+        for _ in range(11):
+            limiter.acquire()
+            limiter.release(200)
+        self.assertGreaterEqual(time.monotonic() - start, 0.095)
+        self.assertEqual(RateLimiter.parse_retry_after("3"), 3.0)
+        self.assertEqual(
+            RateLimiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0
+        )
+
+    # test streamed answersets are retried by a single retry loop
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_stream_retry_attempts(self, mock_get):
+        mock_get.side_effect = requests.exceptions.ConnectionError("reset")
+        instance = DRHWrapper(max_retries=3, base_delay=0)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            instance.get_answerset("question", stream=True)
+        self.assertEqual(mock_get.call_count, 3)
+
+        mock_get.reset_mock()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            list(instance.iter_answerset("question"))
+        self.assertEqual(mock_get.call_count, 3)
+
+    # test retry scheduling
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_retry_delay_queue(self, mock_get):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            entry_id = int(url.rstrip("/").split("/")[-1])
+            calls.append(entry_id)
+            failed = entry_id == 0 and calls.count(0) == 1
+            response = MagicMock(
+                status_code=503 if failed else 200, headers={}, content=b"{}"
+            )
+            response.json.return_value = {"id": entry_id}
+            return response
+
+        mock_get.side_effect = fake_get
+        instance = DRHWrapper(base_delay=0.2)
+        entries, failures = instance.find_entries(range(4), max_workers=1)
+        self.assertEqual(failures, {})
+        self.assertEqual([entry["id"] for entry in entries], [0, 1, 2, 3])
+        # the worker fetched the other entries while entry 0 waited for its retry
+        self.assertEqual(calls, [0, 1, 2, 3, 0])
+        self.assertEqual(instance.stats()["retries"], {"find_entry": 1})
+
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_retry_classification_and_budget(self, mock_get):
+        not_found = MagicMock(status_code=404, headers={}, content=b"{}")
+        mock_get.return_value = not_found
+        instance = DRHWrapper(base_delay=0)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            instance.find_entry(1)
+        self.assertEqual(mock_get.call_count, 1)
+
+        mock_get.reset_mock()
+        mock_get.return_value = MagicMock(status_code=503, headers={}, content=b"")
+        instance = DRHWrapper(base_delay=0, retry_budget=0.5)
+        instance.retry_budget.min_retries = 1
+        with self.assertRaises(requests.exceptions.HTTPError) as raised:
+            instance.find_entry(1)
+        self.assertEqual(raised.exception.response.status_code, 503)
+        # retries allowed: 1 + 0.5 per request sent, so the 4th failure is final
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(instance.retry_budget.info()["exhausted"], 1)
+
+        self.assertTrue(is_retryable(requests.exceptions.ReadTimeout()))
+        self.assertTrue(is_retryable(asyncio.TimeoutError()))
+        self.assertTrue(is_retryable(json.JSONDecodeError("Incomplete", "[", 1)))
+        self.assertFalse(is_retryable(ValueError("Expected a JSON array")))
+
+    # test timeouts and hedged requests
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_timeouts_and_hedging(self, mock_get):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(kwargs["timeout"])
+            if len(calls) == 1:
+                time.sleep(0.5)  # stuck first request
+            response = MagicMock(status_code=200, headers={}, content=b"{}")
+            response.json.return_value = {"id": len(calls)}
+            return response
+
+        mock_get.side_effect = fake_get
+        instance = DRHWrapper(timeout=5, hedge_quantile=0.95)
+        for _ in range(instance.HEDGE_MIN_SAMPLES):
+            instance.metrics.request("entries", time.perf_counter() - 0.05)
+        start = time.monotonic()
+        entry = instance.find_entry(1)
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(entry, {"id": 2})
+        self.assertEqual(calls, [5, 5])
+        self.assertEqual(instance.stats()["hedges"], {"entries": {"sent": 1, "won": 1}})
+
+        instance.get_answerset("question", to_dataframe=False)
+        # answersets are given more time to be generated
+        self.assertEqual(calls[-1], instance.ENDPOINT_TIMEOUTS["entries-by-question"])
+        instance.close()
+
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_hedging_is_bounded(self, mock_get):
+        def fake_get(url, **kwargs):
+            time.sleep(0.2)  # stalled server
+            response = MagicMock(status_code=200, headers={}, content=b"{}")
+            response.json.return_value = {}
+            return response
+
+        mock_get.side_effect = fake_get
+        instance = DRHWrapper(pool_size=1, hedge_quantile=0.95)
+        adapter = instance.session.get_adapter(instance.base_url)
+        # one extra connection for the one duplicate allowed in flight
+        self.assertEqual(adapter._pool_maxsize, 2)
+        for _ in range(instance.HEDGE_MIN_SAMPLES):
+            instance.metrics.request("entries", time.perf_counter() - 0.01)
+        entries, failures = instance.find_entries(range(3), max_workers=3)
+        self.assertEqual(failures, {})
+        # every call sent its request at once, but only one duplicate was sent
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(instance.stats()["hedges"]["entries"]["sent"], 1)
+
+    # test request instrumentation
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_stats_and_hook(self, mock_get):
+        page = {"count": 0, "next": None, "previous": None, "results": []}
+        ok = MagicMock(status_code=200, content=b'{"count": 0}', headers={})
+        ok.json.return_value = page
+        failed = MagicMock(status_code=503, content=b"", headers={})
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError("503")
+        mock_get.side_effect = [failed, ok, ok]
+        events = []
+        instance = DRHWrapper(base_delay=0, find_cache_size=1, hook=events.append)
+        instance.list_regions()
+        instance.find_region(1)
+        instance.find_region(1)
+
+        self.assertEqual(
+            [event["type"] for event in events],
+            ["request", "retry", "request", "parse", "cache", "request", "cache"],
+        )
+        stats = instance.stats()
+        self.assertEqual(stats["requests"]["regions"]["requests"], 3)
+        self.assertEqual(stats["requests"]["regions"]["errors"], 1)
+        self.assertEqual(stats["requests"]["regions"]["bytes"], 24)
+        self.assertEqual(stats["retries"], {"list_information": 1})
+        self.assertEqual(stats["cache"]["regions"], {"miss": 1, "hit": 1})
+        self.assertEqual(stats["parse"]["list_regions_to_dataframe"]["calls"], 1)
+
+    # test single-pass list converters
+    def test_list_entries_to_dataframe(self):
+        entry = {
+            "id": 23,
+            "name": {"id": 47, "name": "Late Shang Religion"},
+            "expert": {"id": 22, "first_name": "Clayton", "last_name": "Ashton"},
+            "poll": {"id": 8, "name": "Polity"},
+            "date_created": "2014-04-17T05:00:00Z",
+            "year_from": -1250,
+            "year_to": -1046,
+            "region": {"id": 5, "name": "Shang"},
+            "tags": [{"id": 8, "name": "Religious Group"}],
+        }
+        result_df = DRHWrapper.list_entries_to_dataframe({"results": [entry, entry]})
+        self.assertEqual(
+            result_df.iloc[0].tolist(),
+            [
+                23,
+                "Late Shang Religion",
+                22,
+                "Clayton Ashton",
+                8,
+                "Polity",
+                "2014-04-17T05:00:00Z",
+                -1250,
+                -1046,
+                5,
+                "Shang",
+                [{"id": 8, "name": "Religious Group"}],
+            ],
+        )
+        self.assertEqual(result_df["year_from"].dtype, np.int64)
+        self.assertEqual(len(result_df), 2)
+
+        instance = DRHWrapper()
+        page = {"count": 2, "next": None, "results": [entry, entry]}
+        with patch.object(instance, "_get_json", return_value=page):
+            compact_df = instance.list_entries(compact=True)
+        self.assertEqual(str(compact_df["year_from"].dtype), "Int16")
+        self.assertEqual(str(compact_df["poll_name"].dtype), "category")
+
+    @staticmethod
+    def fake_question(question_id, answers):
+        """Question with one answer set containing answers."""
+        return {
+            "id": question_id,
+            "name": f"Question {question_id}",
+            "answer_sets": [
+                {
+                    "id": question_id * 10,
+                    "year_from": -500,
+                    "year_to": 500,
+                    "region_id": 1,
+                    "expert_id": 2,
+                    "status_of_participants": [0, 2],
+                    "notes": None,
+                    "answers": answers,
+                }
+            ],
+        }
+
+    @staticmethod
+    def fake_answer(answer_id, sub_questions=()):
+        """Answer with optional sub-questions."""
+        return {
+            "id": answer_id,
+            "name": "Yes",
+            "value": 1,
+            "text_input": None,
+            "sub_questions": list(sub_questions),
+        }
+
+    # test answer extraction order (sub-questions follow their answer)
+    def test_extract_answer_information_order(self):
+        question, answer = self.fake_question, self.fake_answer
+
+        sub_question = question(2, [answer(21, [question(3, [answer(31)])])])
+        questions = [
+            question(1, [answer(11, [sub_question, sub_question]), answer(12)]),
+            question(4, [answer(41)]),
+        ]
+        df_entries = pd.DataFrame(
+            {
+                "entry_id": [939],
+                "entry_name": ["Goodenough and Fergusson Islanders"],
+                "categories": [
+                    [
+                        {"id": 1, "name": "Beliefs", "questions": questions},
+                        {
+                            "id": 2,
+                            "name": "Practices",
+                            "questions": [],
+                            "groups": [
+                                {
+                                    "id": 7,
+                                    "name": "Group",
+                                    "questions": [question(5, [answer(51)])],
+                                }
+                            ],
+                        },
+                    ]
+                ],
+            }
+        )
+        result_df = DRHWrapper().extract_answer_information(df_entries)
+
+        self.assertEqual(result_df["answer_id"].tolist(), [11, 21, 31, 12, 41, 51])
+        self.assertEqual(
+            result_df["parent_question_id"].tolist(),
+            [pd.NA, 1, 2, pd.NA, pd.NA, pd.NA],
+        )
+        self.assertEqual(
+            result_df["question_group_id"].tolist(),
+            [pd.NA, pd.NA, pd.NA, pd.NA, pd.NA, 7],
+        )
+        self.assertEqual(
+            result_df["answer_set_status_of_participants_name"][0],
+            ["Elite", "Non-elite (common people, general populace)"],
+        )
+        self.assertEqual(len(result_df.columns), 21)
+
+    # test streaming answer extraction from raw entries
+    def test_iter_answer_information(self):
+        question, answer = self.fake_question, self.fake_answer
+        entries = [
+            {
+                "id": entry_id,
+                "name": {"id": entry_id + 1, "name": f"entry {entry_id}"},
+                "categories": [
+                    {
+                        "id": 1,
+                        "name": "Beliefs",
+                        "questions": [question(entry_id, [answer(1), answer(2)])],
+                    }
+                ],
+            }
+            for entry_id in [4, 2, 9]
+        ]
+        instance = DRHWrapper()
+        with patch.object(
+            instance, "find_entry", side_effect=lambda entry_id: entries[entry_id]
+        ):
+            chunks = list(
+                instance.iter_answer_information(
+                    instance.iter_find_entries([0, 1, 2], max_workers=2), chunk_size=2
+                )
+            )
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 2])
+        self.assertEqual(pd.concat(chunks)["entry_id"].tolist(), [4, 4, 2, 2, 9, 9])
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True),
+            instance.extract_answer_information(
+                instance.entry_list_to_dataframe(entries)
+            ),
+        )
+
+    # test compact dtypes
+    def test_compact_dataframe(self):
+        df = pd.DataFrame(
+            {
+                "entry_id": [1, 2, 300, 4],
+                "year_from": [-3000, 0, 1900, None],
+                "poll_name": ["Religious Group", "Religious Group", "Text", None],
+                "entry_name": ["a", "b", "c", "d"],
+                "tags": [[1], [], [2], []],
+            }
+        ).astype({"year_from": "Int64"})
+        compact_df = DRHWrapper.compact_dataframe(df)
+        self.assertEqual(str(compact_df["entry_id"].dtype), "Int16")
+        self.assertEqual(str(compact_df["year_from"].dtype), "Int16")
+        self.assertEqual(str(compact_df["poll_name"].dtype), "category")
+        self.assertIsInstance(compact_df["entry_name"].dtype, pd.StringDtype)
+        self.assertEqual(compact_df["tags"].dtype, object)
+        self.assertEqual(compact_df["entry_id"].tolist(), [1, 2, 300, 4])
+        self.assertTrue(pd.isna(compact_df["year_from"][3]))
+        self.assertTrue(pd.isna(compact_df["poll_name"][3]))
+
+    # test multiprocess answer extraction
+    def test_extract_answer_information_parallel(self):
+        question, answer = self.fake_question, self.fake_answer
+        df_entries = pd.DataFrame(
+            {
+                "entry_id": [3, 1, 2],
+                "entry_name": ["c", "a", "b"],
+                "categories": [
+                    [
+                        {
+                            "id": 1,
+                            "name": "Beliefs",
+                            "questions": [question(entry_id, [answer(entry_id)])],
+                        }
+                    ]
+                    for entry_id in [3, 1, 2]
+                ],
+            }
+        )
+        instance = DRHWrapper()
+        expected_df = instance.extract_answer_information(df_entries)
+        result_df = instance.extract_answer_information(
+            df_entries, n_workers=2, chunk_size=1
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+        self.assertEqual(result_df["entry_id"].tolist(), [3, 1, 2])
+
+    # test streaming answerset parsing
+    @patch("drhwrapper.api.requests.Session.get")
+    def test_iter_answerset_streams_body(self, mock_get):
+        answerset = [
+            {
+                "id": entry_id,
+                "title": f"entry {entry_id}",
+                "date_created": "2020-08-04T03:44:24.479188Z",
+                "poll": {"id": 8, "name": "Religious Group (v6)"},
+                "question_id": 4828,
+                "answers": [
+                    {
+                        "name": "Yes",
+                        "value": 1,
+                        "year_from": -500 - entry_id,
+                        "year_to": 1.5e3,
+                        "expert": {
+                            "expert_id": 7,
+                            "first_name": "Jane",
+                            "last_name": "Doé",
+                        },
+                        "region_id": 12,
+                        "status_of_participants": {"id": 0, "name": "Elite"},
+                    }
+                ],
+            }
+            for entry_id in [3, 1, 2]
+        ]
+        body = json.dumps(answerset).encode("utf-8")
+        # split multi-byte characters and numbers across chunks
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"Content-Length": str(len(body))}
+        mock_get.return_value.iter_content.side_effect = lambda chunk_size: (
+            body[start : start + 5] for start in range(0, len(body), 5)
+        )
+        instance = DRHWrapper()
+        expected_df = instance.extract_answerset(answerset)
+
+        chunks = list(instance.iter_answerset("question", chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected_df)
+        pd.testing.assert_frame_equal(
+            instance.get_answerset("question", stream=True), expected_df
+        )
+        self.assertEqual(
+            list(instance.iter_answerset("question", to_dataframe=False)), answerset
+        )
+        compact_chunks = list(instance.iter_answerset("question", compact=True))
+        self.assertEqual(str(compact_chunks[0]["poll_name"].dtype), "category")
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+        # elements are separated by exactly one comma, and none precedes "]"
+        for body in [b"[1,]", b"[1,,2]", b"[,1]", b"[1 2]", b"[1,"]:
+            mock_get.return_value.iter_content.side_effect = lambda chunk_size: [body]
+            with self.assertRaises(json.JSONDecodeError):
+                list(instance.iter_answerset("question", to_dataframe=False))
+        mock_get.return_value.iter_content.side_effect = lambda chunk_size: [
+            b" [ 1 ,",
+            b"2 , [ ] ] ",
+        ]
+        self.assertEqual(
+            list(instance.iter_answerset("question", to_dataframe=False)), [1, 2, []]
+        )
+
+    # test batch answerset retrieval
+    def test_get_answersets(self):
+        def fake_get_answerset(question_name, to_dataframe=True, stream=False):
+            if question_name == "broken":
+                raise requests.exceptions.HTTPError("500 Server Error")
+            return pd.DataFrame(
+                {column: [len(question_name)] for column in ANSWERSET_COLUMNS}
+            )
+
+        instance = DRHWrapper()
+        with patch.object(
+            instance, "get_answerset", side_effect=fake_get_answerset
+        ) as mock_get_answerset:
+            df, failures = instance.get_answersets(
+                ["b", "aa", "broken", "b"], max_workers=2, return_failures=True
+            )
+        self.assertEqual(mock_get_answerset.call_count, 3)
+        self.assertEqual(list(failures), ["broken"])
+        self.assertEqual(list(df.columns), ["question_name"] + ANSWERSET_COLUMNS)
+        self.assertEqual(df["question_name"].tolist(), ["b", "aa"])
+        self.assertEqual(df["entry_id"].tolist(), [1, 2])
+
+        with patch.object(instance, "get_answerset", side_effect=fake_get_answerset):
+            compact_df = instance.get_answersets(["b", "aa", "b2"], compact=True)
+        self.assertEqual(str(compact_df["entry_id"].dtype), "Int8")
+
+    # test raw records
+    def test_raw_records_skip_pandas(self):
+        answerset = [{"id": 1, "title": "entry 1", "answers": []}]
+        entry = {"id": 7, "name": "entry 7"}
+        instance = DRHWrapper()
+        # pandas is unavailable to the wrapper, so any DataFrame construction fails
+        with patch("drhwrapper.api.pd", None), patch.object(
+            instance, "_get_json", return_value=answerset
+        ), patch.object(instance, "find_entry", return_value=entry):
+            self.assertEqual(
+                instance.get_answerset("question", to_dataframe=False), answerset
+            )
+            self.assertEqual(
+                instance.get_answersets(["a", "b"], to_dataframe=False),
+                {"a": answerset, "b": answerset},
+            )
+            self.assertEqual(
+                instance.dataframe_from_entry_id_list([7], to_dataframe=False), [entry]
+            )
+        response = MagicMock()
+        response.iter_content.return_value = [json.dumps(answerset).encode("utf-8")]
+        with patch("drhwrapper.api.pd", None), patch.object(
+            instance, "_open_stream", return_value=response
+        ):
+            self.assertEqual(
+                instance.get_answerset("question", to_dataframe=False, stream=True),
+                answerset,
+            )
+
+    # test parquet snapshot
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_save_snapshot(self):
+        question, answer = self.fake_question, self.fake_answer
+        entries = {
+            entry_id: {
+                "id": entry_id,
+                "name": {"id": entry_id + 1, "name": f"entry {entry_id}"},
+                "categories": [
+                    {
+                        "id": 1,
+                        "name": "Beliefs",
+                        "questions": [question(entry_id, [answer(1), answer(2)])],
+                    }
+                ],
+            }
+            for entry_id in [4, 2, 9]
+        }
+        entries_df = pd.DataFrame(
+            {"entry_id": [4, 2, 9], "entry_name": ["d", "b", "i"], "poll_id": [8, 8, 1]}
+        )
+        instance = DRHWrapper()
+        empty = pd.DataFrame()
+        with tempfile.TemporaryDirectory() as tmp, patch.multiple(
+            instance,
+            list_entries=lambda **kwargs: entries_df,
+            list_regions=lambda **kwargs: empty,
+            list_entry_tags=lambda **kwargs: empty,
+            list_region_tags=lambda **kwargs: empty,
+            get_related_questions=lambda: empty,
+            find_entry=lambda entry_id, refresh=False: entries[entry_id],
+        ):
+            store = instance.save_snapshot(tmp, chunk_size=2)
+            self.assertIn("answers", store.tables())
+            self.assertEqual(store.metadata()["tables"]["answers"]["rows"], 6)
+            loaded = (
+                store.load("answers")
+                .sort_values(["entry_id", "answer_id"])
+                .reset_index(drop=True)
+            )
+            expected = instance.extract_answer_information(
+                instance.entry_list_to_dataframe(
+                    [entries[entry_id] for entry_id in [2, 4, 9]]
+                )
+            )
+            # text columns are stored as strings even if all of their values are missing
+            strings = list(SnapshotStore.COLUMN_TYPES["answers"])
+            expected[strings] = expected[strings].astype(loaded[strings].dtypes)
+            pd.testing.assert_frame_equal(loaded, expected)
+            polled = SnapshotStore(tmp).load(
+                "entries", columns=["entry_id"], filters=[("poll_id", "=", 8)]
+            )
+            self.assertEqual(sorted(polled["entry_id"]), [2, 4])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_save_answers_mixed_grouping(self):
+        question, answer = self.fake_question, self.fake_answer
+
+        def entry(entry_id, grouped):
+            questions = [question(entry_id, [answer(1)])]
+            category = {"id": 1, "name": "Beliefs", "questions": []}
+            if grouped:
+                category["groups"] = [
+                    {"id": 7, "name": "Group", "questions": questions}
+                ]
+            else:
+                category["questions"] = questions
+            return {
+                "id": entry_id,
+                "name": {"id": entry_id + 1, "name": f"entry {entry_id}"},
+                "categories": [category],
+            }
+
+        # without a question group the group name column of a chunk is all NaN (float)
+        entries = {1: entry(1, False), 2: entry(2, True)}
+        instance = DRHWrapper()
+        with tempfile.TemporaryDirectory() as tmp, patch.object(
+            instance, "find_entry", entries.get
+        ):
+            store = SnapshotStore(tmp)
+            self.assertEqual(instance.save_answers(store, [1, 2], chunk_size=1), {})
+            answers = store.load("answers").sort_values("entry_id")
+            self.assertTrue(pd.isna(answers["question_group_name"].iloc[0]))
+            self.assertEqual(answers["question_group_name"].iloc[1], "Group")
+            store.upsert(
+                "answers",
+                instance.extract_answer_information(
+                    instance.entry_list_to_dataframe([entries[1]])
+                ),
+                "entry_id",
+            )
+            self.assertEqual(store.dataset("answers").count_rows(), 2)
+
+    # test incremental snapshot sync
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_snapshot_upsert_rewrites_changed_files(self):
+        def files(path):
+            return {
+                os.path.join(root, name): os.stat(os.path.join(root, name)).st_mtime_ns
+                for root, _, names in os.walk(path)
+                for name in names
+                if name.endswith(".parquet")
+            }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SnapshotStore(tmp)
+            for poll_id in [1, 2, 3]:
+                store.write(
+                    "entries",
+                    pd.DataFrame(
+                        {
+                            "entry_id": [poll_id * 10, poll_id * 10 + 1],
+                            "entry_name": ["old", "old"],
+                            "poll_id": [poll_id] * 2,
+                        }
+                    ),
+                    append=True,
+                )
+            before = files(tmp)
+            time.sleep(0.01)
+            # entry 10 changed, entries 20 and 21 were deleted and entry 40 is new
+            store.upsert(
+                "entries",
+                pd.DataFrame(
+                    {
+                        "entry_id": [10, 40],
+                        "entry_name": ["new", "new"],
+                        "poll_id": [1, 4],
+                    }
+                ),
+                "entry_id",
+                keys=[10, 20, 21, 40],
+            )
+            after = files(tmp)
+            untouched = {
+                path: mtime for path, mtime in before.items() if "poll_id=3" in path
+            }
+            self.assertEqual({path: after[path] for path in untouched}, untouched)
+            # the file of poll 1 is rewritten, the file of poll 2 is empty and removed
+            self.assertTrue(
+                all(
+                    after.get(path) != before[path]
+                    for path in before
+                    if "poll_id=3" not in path
+                )
+            )
+            self.assertFalse([path for path in after if "poll_id=2" in path])
+            rows = store.load("entries").sort_values("entry_id")
+            self.assertEqual(rows["entry_id"].tolist(), [10, 11, 30, 31, 40])
+            self.assertEqual(
+                rows["entry_name"].tolist(), ["new", "old", "old", "old", "new"]
+            )
+            self.assertEqual(store.metadata()["tables"]["entries"]["rows"], 5)
+
+            # a failed write of the new rows leaves the table (and its old rows) as is
+            changed = pd.DataFrame(
+                {"entry_id": [11], "entry_name": [np.nan], "poll_id": [1]}
+            )
+            with patch.object(store, "_write_files", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    store.upsert("entries", changed, "entry_id")
+            self.assertEqual(files(tmp), after)
+            self.assertFalse([name for name in os.listdir(tmp) if ".tmp" in name])
+            # rows without a value for a string column still match the stored schema
+            store.upsert("entries", changed, "entry_id")
+            rows = store.load("entries").sort_values("entry_id")
+            self.assertEqual(rows["entry_id"].tolist(), [10, 11, 30, 31, 40])
+            self.assertTrue(pd.isna(rows["entry_name"].iloc[1]))
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_sync_snapshot(self):
+        question, answer = self.fake_question, self.fake_answer
+
+        def fake_entry(entry_id, answer_ids):
+            return {
+                "id": entry_id,
+                "name": {"id": entry_id + 1, "name": f"entry {entry_id}"},
+                "categories": [
+                    {
+                        "id": 1,
+                        "name": "Beliefs",
+                        "questions": [
+                            question(entry_id, [answer(i) for i in answer_ids])
+                        ],
+                    }
+                ],
+            }
+
+        def entries_df(entry_ids):
+            return pd.DataFrame(
+                {
+                    "entry_id": entry_ids,
+                    "entry_name": [f"entry {entry_id}" for entry_id in entry_ids],
+                    "poll_id": [8] * len(entry_ids),
+                }
+            )
+
+        entries = {entry_id: fake_entry(entry_id, [1, 2]) for entry_id in [4, 2, 9]}
+        list_entries = MagicMock(return_value=entries_df([4, 2, 9]))
+        find_entry = MagicMock(
+            side_effect=lambda entry_id, refresh=False: entries[entry_id]
+        )
+        instance = DRHWrapper()
+        empty = pd.DataFrame()
+        with tempfile.TemporaryDirectory() as tmp, patch.multiple(
+            instance,
+            list_entries=list_entries,
+            list_regions=lambda **kwargs: empty,
+            list_entry_tags=lambda **kwargs: empty,
+            list_region_tags=lambda **kwargs: empty,
+            get_related_questions=lambda: empty,
+            find_entry=find_entry,
+        ):
+            # without a watermark the whole snapshot is written
+            self.assertEqual(instance.sync_snapshot(tmp), {})
+            watermark = SnapshotStore(tmp).watermark()
+            self.assertIsNotNone(watermark)
+            self.assertIsNone(list_entries.call_args.kwargs["start_date"])
+
+            # entry 2 lost an answer and entry 5 is new
+            entries[2] = fake_entry(2, [1])
+            entries[5] = fake_entry(5, [3])
+            list_entries.return_value = entries_df([2, 5])
+            find_entry.reset_mock()
+            self.assertEqual(instance.sync_snapshot(tmp), {})
+
+            self.assertEqual(list_entries.call_args.kwargs["start_date"], watermark)
+            self.assertEqual(
+                sorted(call.args[0] for call in find_entry.call_args_list), [2, 5]
+            )
+            # cached responses may predate the watermark, so the caches are bypassed
+            self.assertTrue(list_entries.call_args.kwargs["refresh"])
+            self.assertTrue(
+                all(call.kwargs["refresh"] for call in find_entry.call_args_list)
+            )
+            store = SnapshotStore(tmp)
+            self.assertEqual(sorted(store.load("entries")["entry_id"]), [2, 4, 5, 9])
+            answers = store.load("answers", columns=["entry_id", "answer_id"])
+            self.assertEqual(
+                sorted(zip(answers["entry_id"], answers["answer_id"])),
+                [(2, 1), (4, 1), (4, 2), (5, 3), (9, 1), (9, 2)],
+            )
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class TestAsyncDRHWrapper(unittest.IsolatedAsyncioTestCase):
+    # test async client shares parsing with the sync client
+    async def test_list_regions_matches_sync(self):
+        page = {
+            "count": 1,
+            "next": None,
+            "previous": None,
+            "results": [
+                {
+                    "id": 805,
+                    "name": "Mongolia ca. 1920",
+                    "description": "Khalkha Mongols",
+                    "created_by": {"id": 697, "first_name": "Emily", "last_name": "P"},
+                    "geom": {"type": "MultiPolygon", "coordinates": [[[[96.8, 47.1]]]]},
+                    "tags": [],
+                }
+            ],
+        }
+        sync_instance = DRHWrapper()
+        with patch.object(sync_instance, "_get_json", return_value=page):
+            expected_df = sync_instance.list_regions(created_by=[1, 2])
+
+        instance = AsyncDRHWrapper()
+        with patch.object(
+            instance, "_get_json", AsyncMock(return_value=page)
+        ) as mock_get:
+            result_df = await instance.list_regions(created_by=[1, 2])
+
+        mock_get.assert_awaited_once_with(
+            "regions", params={"limit": 25, "created_by": "1,2"}
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    # test async client shares answer extraction with the sync client
+    async def test_extract_answer_information_matches_sync(self):
+        question, answer = TestDRHWrapper.fake_question, TestDRHWrapper.fake_answer
+        questions = [
+            question(1, [answer(11, [question(2, [answer(21)])]), answer(12)]),
+            question(4, [answer(41)]),
+        ]
+        df_entries = pd.DataFrame(
+            {
+                "entry_id": [939],
+                "entry_name": ["Goodenough and Fergusson Islanders"],
+                "categories": [[{"id": 1, "name": "Beliefs", "questions": questions}]],
+            }
+        )
+        expected_df = DRHWrapper().extract_answer_information(df_entries)
+
+        instance = AsyncDRHWrapper()
+        result_df = instance.extract_answer_information(df_entries)
+        self.assertEqual(result_df["answer_id"].tolist(), [11, 21, 12, 41])
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    # test async retry policy
+    async def test_find_entry_retries(self):
+        instance = AsyncDRHWrapper(max_retries=2, base_delay=0)
+        entry = {"id": 23, "name": {"id": 47, "name": "Late Shang Religion"}}
+        side_effect = [aiohttp.ClientConnectionError("reset"), entry]
+        with patch.object(instance, "_get_json", AsyncMock(side_effect=side_effect)):
+            result = await instance.find_entry(23)
+        self.assertEqual(result, entry)
+        await instance.close()
+
 
 # Run the tests
 if __name__ == "__main__":